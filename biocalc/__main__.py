@@ -11,8 +11,8 @@ Usage:
 import sys
 import argparse
 from .repl import start_repl
-from .constants import list_constants, get_constant, search_constants
-from .units import convert, format_quantity
+from .constants import list_constants, iter_search_constants
+from .units import convert, format_constant, format_quantity
 from .parser import evaluate, energy
 
 
@@ -81,27 +81,31 @@ def main():
     # Handle --list
     if args.list:
         constants = list_constants()
-        print("\nAvailable constants:")
-        print("-" * 60)
+        # Build the whole listing and emit it with a single write
+        lines = ["\nAvailable constants:", "-" * 60]
         for name in constants:
             try:
-                value = get_constant(name)
-                print(f"  {name:30s} = {format_quantity(value, args.precision)}")
-            except:
+                lines.append(
+                    f"  {name:30s} = {format_constant(name, args.precision)}"
+                )
+            except (KeyError, ValueError, AttributeError):
                 pass
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0
     
     # Handle --search
     if args.search:
-        results = search_constants(args.search)
-        if not results:
+        lines = [
+            f"  {name:30s} = {format_quantity(value, args.precision)}"
+            for name, value in iter_search_constants(args.search)
+        ]
+        if not lines:
             print(f"No constants found matching '{args.search}'")
             return 1
-        
+
         print(f"\nConstants matching '{args.search}':")
         print("-" * 60)
-        for name, value in results.items():
-            print(f"  {name:30s} = {format_quantity(value, args.precision)}")
+        print("\n".join(lines))
         return 0
     
     # Handle --convert
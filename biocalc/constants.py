@@ -2,78 +2,123 @@
 Physical and biological constants with units.
 """
 
+from collections.abc import Mapping
+
 from pint import UnitRegistry
 
 # Initialize unit registry
 ureg = UnitRegistry()
 
-# Define biochemical and physical constants
-CONSTANTS = {
+# Define biochemical and physical constants as (magnitude, unit string)
+# pairs. Quantity objects are built lazily (see CONSTANTS below) because
+# each unit parse costs hundreds of microseconds and numeric-only code
+# paths never need them.
+CONSTANTS_RAW = {
     # Fundamental constants
-    "avogadro": 6.02214076e23 * ureg("1/mol"),
-    "N_A": 6.02214076e23 * ureg("1/mol"),
-    "boltzmann": 1.380649e-23 * ureg("J/K"),
-    "k_B": 1.380649e-23 * ureg("J/K"),
-    "R": 8.314462618 * ureg("J/(mol*K)"),
-    "gas_constant": 8.314462618 * ureg("J/(mol*K)"),
-    "planck": 6.62607015e-34 * ureg("J*s"),
-    "h": 6.62607015e-34 * ureg("J*s"),
-    "speed_of_light": 299792458 * ureg("m/s"),
-    "c": 299792458 * ureg("m/s"),
-    "elementary_charge": 1.602176634e-19 * ureg("C"),
-    "e": 1.602176634e-19 * ureg("C"),
-    "faraday": 96485.33212 * ureg("C/mol"),
-    "F": 96485.33212 * ureg("C/mol"),
-    
+    "avogadro": (6.02214076e23, "1/mol"),
+    "N_A": (6.02214076e23, "1/mol"),
+    "boltzmann": (1.380649e-23, "J/K"),
+    "k_B": (1.380649e-23, "J/K"),
+    "R": (8.314462618, "J/(mol*K)"),
+    "gas_constant": (8.314462618, "J/(mol*K)"),
+    "planck": (6.62607015e-34, "J*s"),
+    "h": (6.62607015e-34, "J*s"),
+    "speed_of_light": (299792458, "m/s"),
+    "c": (299792458, "m/s"),
+    "elementary_charge": (1.602176634e-19, "C"),
+    "e": (1.602176634e-19, "C"),
+    "faraday": (96485.33212, "C/mol"),
+    "F": (96485.33212, "C/mol"),
+
     # Biochemical energies
-    "ATP_hydrolysis": 50e3 * ureg("J/mol"),
-    "ATP_synthesis": -50e3 * ureg("J/mol"),
-    "GTP_hydrolysis": 50e3 * ureg("J/mol"),
-    "proton_motive_force": 200e-3 * ureg("V"),
-    
+    "ATP_hydrolysis": (50e3, "J/mol"),
+    "ATP_synthesis": (-50e3, "J/mol"),
+    "GTP_hydrolysis": (50e3, "J/mol"),
+    "proton_motive_force": (200e-3, "V"),
+
     # Diffusion coefficients (in water at 25°C)
-    "diffusion_O2_water": 2.1e-9 * ureg("m^2/s"),
-    "diffusion_glucose_water": 0.67e-9 * ureg("m^2/s"),
-    "diffusion_protein_water": 0.1e-9 * ureg("m^2/s"),
-    "diffusion_ion_water": 2.0e-9 * ureg("m^2/s"),
-    
+    "diffusion_O2_water": (2.1e-9, "m^2/s"),
+    "diffusion_glucose_water": (0.67e-9, "m^2/s"),
+    "diffusion_protein_water": (0.1e-9, "m^2/s"),
+    "diffusion_ion_water": (2.0e-9, "m^2/s"),
+
     # Standard conditions
-    "standard_temperature": 298.15 * ureg("K"),
-    "T_std": 298.15 * ureg("K"),
-    "standard_pressure": 101325 * ureg("Pa"),
-    "P_std": 101325 * ureg("Pa"),
-    "body_temperature": 310.15 * ureg("K"),
-    "T_body": 310.15 * ureg("K"),
-    
+    "standard_temperature": (298.15, "K"),
+    "T_std": (298.15, "K"),
+    "standard_pressure": (101325, "Pa"),
+    "P_std": (101325, "Pa"),
+    "body_temperature": (310.15, "K"),
+    "T_body": (310.15, "K"),
+
     # Molecular masses (g/mol)
-    "mass_ATP": 507.18 * ureg("g/mol"),
-    "mass_glucose": 180.16 * ureg("g/mol"),
-    "mass_water": 18.015 * ureg("g/mol"),
-    "mass_O2": 32.0 * ureg("g/mol"),
-    "mass_CO2": 44.01 * ureg("g/mol"),
-    
+    "mass_ATP": (507.18, "g/mol"),
+    "mass_glucose": (180.16, "g/mol"),
+    "mass_water": (18.015, "g/mol"),
+    "mass_O2": (32.0, "g/mol"),
+    "mass_CO2": (44.01, "g/mol"),
+
     # Biological concentrations (typical)
-    "conc_ATP_cell": 5e-3 * ureg("mol/L"),
-    "conc_glucose_blood": 5e-3 * ureg("mol/L"),
-    "pH_blood": 7.4 * ureg(""),
-    "pH_cytoplasm": 7.2 * ureg(""),
-    
+    "conc_ATP_cell": (5e-3, "mol/L"),
+    "conc_glucose_blood": (5e-3, "mol/L"),
+    "pH_blood": (7.4, ""),
+    "pH_cytoplasm": (7.2, ""),
+
     # Membrane properties
-    "membrane_potential": -70e-3 * ureg("V"),
-    "membrane_capacitance": 1e-2 * ureg("F/m^2"),
-    
+    "membrane_potential": (-70e-3, "V"),
+    "membrane_capacitance": (1e-2, "F/m^2"),
+
     # Viscosity
-    "viscosity_water": 0.001 * ureg("Pa*s"),
-    
+    "viscosity_water": (0.001, "Pa*s"),
+
     # Other useful constants
-    "gravitational_acceleration": 9.80665 * ureg("m/s^2"),
-    "g": 9.80665 * ureg("m/s^2"),
+    "gravitational_acceleration": (9.80665, "m/s^2"),
+    "g": (9.80665, "m/s^2"),
 }
 
 
+class _LazyConstants(Mapping):
+    """Mapping of constant names to pint Quantities, built on first access.
+
+    Looks and behaves like the old eager ``CONSTANTS`` dict, but defers
+    each ``ureg(...)`` unit parse until a caller actually needs the
+    Quantity, then memoizes it.
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._cache = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._cache[name]
+        except KeyError:
+            magnitude, unit = self._raw[name]
+            quantity = magnitude * ureg(unit)
+            self._cache[name] = quantity
+            return quantity
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+
+CONSTANTS = _LazyConstants(CONSTANTS_RAW)
+
+
+# Pre-lowered (lower_name, name) pairs so searches avoid per-query .lower()
+# calls on every constant name
+_LOWER_INDEX = tuple((name.lower(), name) for name in CONSTANTS)
+
+# Sorted names and the "available constants" error text, computed once
+_SORTED_NAMES = tuple(sorted(CONSTANTS.keys()))
+_AVAILABLE_NAMES_TEXT = ", ".join(_SORTED_NAMES)
+
+
 def list_constants():
     """Return a list of all available constant names."""
-    return sorted(CONSTANTS.keys())
+    return list(_SORTED_NAMES)
 
 
 def get_constant(name):
@@ -96,30 +141,47 @@ def get_constant(name):
         If constant not found
     """
     if name not in CONSTANTS:
-        available = ", ".join(list_constants())
         raise KeyError(
-            f"Unknown constant '{name}'. Available constants: {available}"
+            f"Unknown constant '{name}'. "
+            f"Available constants: {_AVAILABLE_NAMES_TEXT}"
         )
     return CONSTANTS[name]
 
 
+def iter_search_constants(query):
+    """
+    Lazily iterate over constants matching a query string.
+
+    Parameters
+    ----------
+    query : str
+        Search term (case-insensitive)
+
+    Yields
+    ------
+    tuple
+        (name, value) pairs of matching constants
+    """
+    query_lower = query.lower()
+    return (
+        (name, CONSTANTS[name])
+        for lower_name, name in _LOWER_INDEX
+        if query_lower in lower_name
+    )
+
+
 def search_constants(query):
     """
     Search for constants matching a query string.
-    
+
     Parameters
     ----------
     query : str
         Search term (case-insensitive)
-        
+
     Returns
     -------
     dict
         Dictionary of matching constants
     """
-    query_lower = query.lower()
-    return {
-        name: value
-        for name, value in CONSTANTS.items()
-        if query_lower in name.lower()
-    }
+    return dict(iter_search_constants(query))
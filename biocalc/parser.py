@@ -2,47 +2,106 @@
 Expression parsing and evaluation with symbolic and numeric support.
 """
 
+import functools
+import math
 import re
-from sympy import sympify, symbols, lambdify
-from sympy.parsing.sympy_parser import (
-    parse_expr,
-    standard_transformations,
-    implicit_multiplication_application,
+import types
+
+from pint.errors import (
+    DefinitionSyntaxError,
+    DimensionalityError,
+    UndefinedUnitError,
 )
-from .constants import CONSTANTS, get_constant
+from .constants import CONSTANTS, CONSTANTS_RAW, get_constant
 from .units import ureg, parse_quantity, add_units
 
 
 # Unit pattern regex (e.g., "K", "mol", "J/mol")
 UNIT_PATTERN = re.compile(r'\b([A-Za-z]+(?:/[A-Za-z]+)?)\b')
 
+# Trailing unit suffix in either form: "* unit" ("R * 300*K") or a
+# whitespace-separated token ("50 kJ/mol")
+_UNIT_TAIL_RE = re.compile(r'(?:\*\s*|\s+)([A-Za-z_][A-Za-z0-9_/^*]*)\s*$')
+
+
+@functools.lru_cache(maxsize=None)
+def _sympy_parser():
+    """Import SymPy's parser machinery on first use (import costs ~200 ms).
+
+    Returns ``(parse_expr, standard_transforms, implicit_transforms)``.
+    The implicit-multiplication transform re-tokenizes the whole input, so
+    callers only apply it when the expression actually needs it (e.g.
+    "300K" or ")(" juxtaposition).
+    """
+    from sympy.parsing.sympy_parser import (
+        parse_expr,
+        standard_transformations,
+        implicit_multiplication_application,
+    )
+    return (
+        parse_expr,
+        standard_transformations,
+        standard_transformations + (implicit_multiplication_application,),
+    )
+
+
+# Patterns that require implicit multiplication: digit-letter ("300K") or
+# closing-paren juxtaposition (")(", ")x")
+_IMPLICIT_MUL_RE = re.compile(r'\d[A-Za-z]|\)[A-Za-z(]')
+
+
+@functools.lru_cache(maxsize=256)
+def _is_unit(token):
+    """Check whether ``token`` parses as a Pint unit (cached per string)."""
+    try:
+        ureg(token)
+        return True
+    except (UndefinedUnitError, DefinitionSyntaxError, DimensionalityError,
+            AssertionError, AttributeError, KeyError, TypeError, ValueError):
+        return False
+
+
+def _build_namespace():
+    """Build the evaluation namespace (constants + math functions) once."""
+    namespace = {}
+
+    # Add all constants (magnitudes only, straight from the raw table --
+    # no pint Quantity construction needed for symbolic evaluation)
+    for name, (magnitude, _unit) in CONSTANTS_RAW.items():
+        namespace[name] = magnitude
+
+    # Add common math functions
+    for func_name in ['sin', 'cos', 'tan', 'exp', 'log', 'log10', 'sqrt']:
+        namespace[func_name] = getattr(math, func_name)
+
+    return namespace
+
+
+# Built once at import time; the constants never change, so every caller can
+# share the same namespace instead of rebuilding it per evaluation.
+_NAMESPACE = _build_namespace()
+_BASE_NAMESPACE = types.MappingProxyType(_NAMESPACE)
+
 
 def create_namespace():
     """
     Create a namespace with all constants for expression evaluation.
-    
+
     Returns
     -------
     dict
         Namespace with constant names mapped to their magnitudes
     """
-    namespace = {}
-    
-    # Add all constants (strip units for symbolic evaluation)
-    for name, value in CONSTANTS.items():
-        namespace[name] = value.magnitude if hasattr(value, 'magnitude') else value
-    
-    # Add common math functions
-    import math
-    for func_name in ['sin', 'cos', 'tan', 'exp', 'log', 'log10', 'sqrt']:
-        namespace[func_name] = getattr(math, func_name)
-    
-    return namespace
+    return dict(_BASE_NAMESPACE)
 
 
+@functools.lru_cache(maxsize=512)
 def parse_expression(expr_str):
     """
     Parse a string expression into a SymPy expression.
+
+    Results are cached per string, so re-evaluating the same expression
+    (common in REPL sessions) skips the SymPy parse entirely.
     
     Parameters
     ----------
@@ -63,16 +122,20 @@ def parse_expression(expr_str):
     avogadro/1000
     """
     try:
-        # Use transformations for implicit multiplication
-        transformations = (
-            standard_transformations + (implicit_multiplication_application,)
-        )
-        
+        parse_expr, standard_transforms, implicit_transforms = _sympy_parser()
+
+        # Explicit-operator expressions don't need the costly implicit-
+        # multiplication transform
+        if '*' in expr_str and not _IMPLICIT_MUL_RE.search(expr_str):
+            transformations = standard_transforms
+        else:
+            transformations = implicit_transforms
+
         # Parse with sympy
         expr = parse_expr(
             expr_str,
             transformations=transformations,
-            local_dict=create_namespace()
+            local_dict=_NAMESPACE
         )
         
         return expr
@@ -80,6 +143,76 @@ def parse_expression(expr_str):
         raise ValueError(f"Cannot parse expression '{expr_str}': {e}") from e
 
 
+# Bare numeric literal, e.g. "50", "1e-3", "-.5"
+_NUMERIC_RE = re.compile(r'[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?')
+
+# Identifiers as Python's grammar sees them, used to vet the compile() path
+_IDENT_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Compiled bytecode objects keyed by expression string for the fast path
+_CODE_CACHE = {}
+
+# Hardware-float math functions handed to lambdify so compiled callables
+# call straight into the math module instead of dispatching through mpmath
+_MATH_MODULES = [
+    {name: getattr(math, name)
+     for name in ('sin', 'cos', 'tan', 'exp', 'log', 'log10', 'sqrt')},
+    'math',
+]
+
+# Compiled numeric callables keyed by expression string, so repeated
+# evaluations invoke a plain Python function instead of re-walking the tree.
+_LAMBDIFIED_CACHE = {}
+
+
+def _fast_numeric_eval(expr_part):
+    """Evaluate ``expr_part`` with plain ``compile``/``eval`` when possible.
+
+    Applies only when every identifier is a known constant or math function
+    and the expression uses Python operator semantics (no ``^`` power
+    notation). Returns ``None`` when the fast path does not apply.
+    """
+    try:
+        code = _CODE_CACHE[expr_part]
+    except KeyError:
+        if '^' in expr_part or '=' in expr_part:
+            return None
+        if not all(name in _BASE_NAMESPACE
+                   for name in _IDENT_RE.findall(expr_part)):
+            return None
+        try:
+            code = compile(expr_part, '<biocalc>', 'eval')
+        except SyntaxError:
+            return None
+        _CODE_CACHE[expr_part] = code
+    return float(eval(code, {'__builtins__': {}}, _NAMESPACE))
+
+
+def _numeric_function(expr_part):
+    """Return a ``(fn, free_names)`` pair compiled from ``expr_part``.
+
+    ``fn`` is a lambdified callable over the expression's free symbols
+    (sorted by name); the pair is cached per expression string.
+    """
+    try:
+        return _LAMBDIFIED_CACHE[expr_part]
+    except KeyError:
+        expr = parse_expression(expr_part)
+        free = tuple(sorted(map(str, expr.free_symbols)))
+
+        if not free:
+            # Constant expression: fold to a hardware float once, no
+            # lambdify needed
+            value = float(expr)
+            fn = lambda: value  # noqa: E731
+        else:
+            from sympy import lambdify
+            fn = lambdify(free, expr, modules=_MATH_MODULES)
+
+        _LAMBDIFIED_CACHE[expr_part] = (fn, free)
+        return fn, free
+
+
 def extract_units_from_expression(expr_str):
     """
     Extract unit strings from an expression.
@@ -102,31 +235,15 @@ def extract_units_from_expression(expr_str):
     >>> extract_units_from_expression("R * 300*K")
     ('R * 300', 'K')
     """
-    # Try to detect if expression has explicit units like "50 kJ/mol"
-    parts = expr_str.split()
-    
-    if len(parts) >= 2:
-        # Check if last part(s) look like units
-        potential_unit = parts[-1]
-        try:
-            ureg(potential_unit)
-            # It's a valid unit
-            expr_part = ' '.join(parts[:-1])
-            return expr_part, potential_unit
-        except:
-            pass
-    
-    # Check for units after * or other operators
-    match = re.search(r'\*\s*([A-Za-z_][A-Za-z0-9_/^*]*)\s*$', expr_str)
+    # Single pass: find a trailing unit token in either "50 kJ/mol" or
+    # "R * 300*K" form
+    match = _UNIT_TAIL_RE.search(expr_str)
     if match:
         unit_part = match.group(1)
-        try:
-            ureg(unit_part)
+        if _is_unit(unit_part):
             expr_part = expr_str[:match.start()].strip().rstrip('*').strip()
             return expr_part, unit_part
-        except:
-            pass
-    
+
     return expr_str, None
 
 
@@ -156,6 +273,12 @@ def evaluate(expr_str, return_units=True, precision=None):
     >>> evaluate("avogadro * 1e-3")
     6.02214076e20
     """
+    # Bare numeric literals skip unit extraction and parsing entirely
+    stripped = expr_str.strip()
+    if _NUMERIC_RE.fullmatch(stripped):
+        value = float(stripped)
+        return round(value, precision) if precision is not None else value
+
     # Extract units if present
     expr_part, unit_str = extract_units_from_expression(expr_str)
     
@@ -166,18 +289,21 @@ def evaluate(expr_str, return_units=True, precision=None):
             if precision is not None:
                 result = round(result.magnitude, precision) * result.units
             return result
-        except:
+        except (ValueError, AttributeError):
             pass
     
-    # Create namespace with constants
-    namespace = create_namespace()
-    
+    # Shared read-only namespace with constants
+    namespace = _BASE_NAMESPACE
+
     try:
-        # Parse and evaluate the expression
-        expr = parse_expression(expr_part)
-        
-        # Substitute constants and evaluate
-        result = float(expr.evalf(subs=namespace))
+        # Fast path: plain compiled bytecode when no SymPy features are needed
+        result = _fast_numeric_eval(expr_part)
+
+        if result is None:
+            # Evaluate via a cached compiled function (constants were already
+            # substituted at parse time through the namespace)
+            fn, free = _numeric_function(expr_part)
+            result = float(fn(*(namespace[name] for name in free)))
         
         # Apply precision if specified
         if precision is not None:
@@ -253,12 +379,11 @@ def substitute_and_eval(expr_str, substitutions):
     >>> substitute_and_eval("R * T", {"T": 300})
     2494.3387854
     """
-    namespace = create_namespace()
-    namespace.update(substitutions)
-    
-    expr = parse_expression(expr_str)
-    result = float(expr.evalf(subs=namespace))
-    
+    namespace = {**_BASE_NAMESPACE, **substitutions}
+
+    fn, free = _numeric_function(expr_str)
+    result = float(fn(*(namespace[name] for name in free)))
+
     return result
 
 
@@ -3,10 +3,38 @@ Interactive REPL (Read-Eval-Print Loop) for biochemical calculations.
 """
 
 import sys
-import readline  # For command history and editing
-from .constants import list_constants, get_constant, search_constants, CONSTANTS
-from .units import convert, format_quantity, ureg
-from .parser import evaluate, energy
+from collections import deque
+from .constants import (
+    list_constants,
+    get_constant,
+    iter_search_constants,
+    CONSTANTS,
+)
+from .units import convert, format_constant, format_quantity, ureg
+from .parser import create_namespace, evaluate, energy
+
+
+def _build_categories():
+    """Group constant names by category for the `list` command."""
+    constants = list_constants()
+    return {
+        'Fundamental': ['avogadro', 'N_A', 'boltzmann', 'k_B', 'R', 'gas_constant',
+                        'planck', 'h', 'speed_of_light', 'c', 'elementary_charge',
+                        'e', 'faraday', 'F'],
+        'Biochemical Energy': ['ATP_hydrolysis', 'ATP_synthesis', 'GTP_hydrolysis',
+                               'proton_motive_force'],
+        'Diffusion': [k for k in constants if 'diffusion' in k],
+        'Temperature & Pressure': ['standard_temperature', 'T_std', 'standard_pressure',
+                                   'P_std', 'body_temperature', 'T_body'],
+        'Molecular Mass': [k for k in constants if 'mass_' in k],
+        'Concentration': [k for k in constants if 'conc_' in k or 'pH' in k],
+        'Membrane': [k for k in constants if 'membrane' in k],
+        'Other': ['viscosity_water', 'gravitational_acceleration', 'g'],
+    }
+
+
+# Computed once at import; the constant set never changes at runtime
+_CATEGORIES = _build_categories()
 
 
 class BioCalcREPL:
@@ -22,7 +50,8 @@ class BioCalcREPL:
             Default decimal precision for output
         """
         self.precision = precision
-        self.history = []
+        # Bounded so long sessions don't grow memory without limit
+        self.history = deque(maxlen=1000)
         self.running = True
         
         # Built-in commands
@@ -36,6 +65,53 @@ class BioCalcREPL:
             'quit': self.cmd_quit,
             'exit': self.cmd_quit,
         }
+
+        # Constants resolved once at construction so per-line lookups are
+        # plain dict hits instead of registry walks
+        self._eval_ns = create_namespace()
+
+        # Pre-bound hot-path callables: attribute loads on self are
+        # cheaper than repeated module-global lookups per REPL line
+        self._fmt = format_quantity
+        self._eval = evaluate
+        self._convert = convert
+        self._energy = energy
+
+        # Function-style commands, dispatched by prefix in process_command
+        self._fn_prefixes = (
+            ('convert(', self._handle_convert),
+            ('energy(', self._handle_energy),
+            ('list_constants(', self._handle_list_constants),
+        )
+
+    def _handle_convert(self, line):
+        """Handle a convert(expr, unit) line; return True if handled."""
+        try:
+            inner = line[8:-1]  # Remove 'convert(' and ')'
+            parts = [p.strip() for p in inner.split(',')]
+            if len(parts) == 2:
+                result = self._convert(parts[0], parts[1])
+                print(self._fmt(result, self.precision))
+                return True
+        except Exception as e:
+            print(f"Error: {e}")
+            return True
+        return False
+
+    def _handle_energy(self, line):
+        """Handle an energy(constant) line; return True if handled."""
+        try:
+            const_name = line[7:-1].strip()
+            result = self._energy(const_name)
+            print(self._fmt(result, self.precision))
+        except Exception as e:
+            print(f"Error: {e}")
+        return True
+
+    def _handle_list_constants(self, line):
+        """Handle a list_constants() line; return True if handled."""
+        self.cmd_list_constants()
+        return True
     
     def cmd_help(self, args=None):
         """Display help message."""
@@ -65,34 +141,20 @@ Supports SI units and automatic conversions.
     
     def cmd_list_constants(self, args=None):
         """List all available constants."""
-        constants = list_constants()
-        print("\nAvailable constants:")
-        print("-" * 60)
-        
-        # Group by category
-        categories = {
-            'Fundamental': ['avogadro', 'N_A', 'boltzmann', 'k_B', 'R', 'gas_constant', 
-                          'planck', 'h', 'speed_of_light', 'c', 'elementary_charge', 
-                          'e', 'faraday', 'F'],
-            'Biochemical Energy': ['ATP_hydrolysis', 'ATP_synthesis', 'GTP_hydrolysis', 
-                                  'proton_motive_force'],
-            'Diffusion': [k for k in constants if 'diffusion' in k],
-            'Temperature & Pressure': ['standard_temperature', 'T_std', 'standard_pressure', 
-                                      'P_std', 'body_temperature', 'T_body'],
-            'Molecular Mass': [k for k in constants if 'mass_' in k],
-            'Concentration': [k for k in constants if 'conc_' in k or 'pH' in k],
-            'Membrane': [k for k in constants if 'membrane' in k],
-            'Other': ['viscosity_water', 'gravitational_acceleration', 'g'],
-        }
-        
-        for category, const_names in categories.items():
+        # Build the whole listing and emit it with a single write
+        lines = ["\nAvailable constants:", "-" * 60]
+
+        for category, const_names in _CATEGORIES.items():
             if not const_names:
                 continue
-            print(f"\n{category}:")
+            lines.append(f"\n{category}:")
             for name in const_names:
                 if name in CONSTANTS:
-                    value = CONSTANTS[name]
-                    print(f"  {name:30s} = {format_quantity(value, self.precision)}")
+                    lines.append(
+                        f"  {name:30s} = {format_constant(name, self.precision)}"
+                    )
+
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def cmd_search(self, args):
         """Search for constants."""
@@ -101,16 +163,18 @@ Supports SI units and automatic conversions.
             return
         
         query = ' '.join(args)
-        results = search_constants(query)
-        
-        if not results:
+        lines = [
+            f"  {name:30s} = {self._fmt(value, self.precision)}"
+            for name, value in iter_search_constants(query)
+        ]
+
+        if not lines:
             print(f"No constants found matching '{query}'")
             return
-        
+
         print(f"\nConstants matching '{query}':")
         print("-" * 60)
-        for name, value in results.items():
-            print(f"  {name:30s} = {format_quantity(value, self.precision)}")
+        print("\n".join(lines))
     
     def cmd_convert(self, args):
         """Convert units."""
@@ -128,8 +192,8 @@ Supports SI units and automatic conversions.
                 expr = ' '.join(args[:-1])
                 target = args[-1]
             
-            result = convert(expr, target)
-            print(format_quantity(result, self.precision))
+            result = self._convert(expr, target)
+            print(self._fmt(result, self.precision))
         except Exception as e:
             print(f"Error: {e}")
     
@@ -142,8 +206,8 @@ Supports SI units and automatic conversions.
         
         try:
             const_name = args[0]
-            result = energy(const_name)
-            print(format_quantity(result, self.precision))
+            result = self._energy(const_name)
+            print(self._fmt(result, self.precision))
         except Exception as e:
             print(f"Error: {e}")
     
@@ -179,48 +243,36 @@ Supports SI units and automatic conversions.
             self.commands[cmd](parts[1:] if len(parts) > 1 else None)
             return
         
-        # Check for function-style commands
+        # Check for function-style commands (convert(...), energy(...), etc.)
         if '(' in line:
-            # Handle convert(...), energy(...), etc.
-            if line.startswith('convert('):
-                # Parse convert(expr, unit)
-                try:
-                    inner = line[8:-1]  # Remove 'convert(' and ')'
-                    parts = [p.strip() for p in inner.split(',')]
-                    if len(parts) == 2:
-                        result = convert(parts[0], parts[1])
-                        print(format_quantity(result, self.precision))
+            for prefix, handler in self._fn_prefixes:
+                if line.startswith(prefix):
+                    if handler(line):
                         return
-                except Exception as e:
-                    print(f"Error: {e}")
-                    return
-            
-            elif line.startswith('energy('):
-                try:
-                    const_name = line[7:-1].strip()
-                    result = energy(const_name)
-                    print(format_quantity(result, self.precision))
-                    return
-                except Exception as e:
-                    print(f"Error: {e}")
-                    return
-            
-            elif line.startswith('list_constants('):
-                self.cmd_list_constants()
-                return
+                    break
         
+        # Bare constant name: resolve directly without an expression parse
+        if line in CONSTANTS:
+            value = CONSTANTS[line]
+            print(self._fmt(value, self.precision))
+            self.history.append((line, self._eval_ns[line]))
+            return
+
         # Otherwise, try to evaluate as expression
         try:
-            result = evaluate(line, return_units=True, precision=self.precision)
+            result = self._eval(line, return_units=True, precision=self.precision)
             
             # Format output
             if hasattr(result, 'units'):
-                print(format_quantity(result, self.precision))
+                print(self._fmt(result, self.precision))
             else:
                 print(f"{result:.{self.precision}f}")
             
-            # Store in history
-            self.history.append((line, result))
+            # Store in history (magnitudes only, so entries don't keep
+            # whole pint Quantity graphs alive)
+            self.history.append(
+                (line, result.magnitude if hasattr(result, 'magnitude') else result)
+            )
             
         except Exception as e:
             print(f"Error: {e}")
@@ -250,4 +302,12 @@ def start_repl(precision=6):
         Decimal precision for output
     """
     repl = BioCalcREPL(precision=precision)
+
+    # Deferred import: readline configures terminal I/O and loads history,
+    # which non-interactive invocations (--list, --convert) never need
+    try:
+        import readline  # noqa: F401  (command history and editing)
+    except ImportError:
+        pass
+
     repl.run()
@@ -4,6 +4,7 @@ import pytest
 from biocalc.units import (
     ureg,
     convert,
+    convert_fast,
     parse_quantity,
     check_dimensionality,
     strip_units,
@@ -79,6 +80,32 @@ def test_temperature_conversion():
     assert result.magnitude == pytest.approx(25.0, rel=1e-2)
 
 
+def test_convert_fast_matches_convert():
+    """Test that the scalar fast path agrees with convert()."""
+    for value, src, dst in [
+        (1.0, "kcal/mol", "J/mol"),
+        (50.0, "kJ/mol", "kcal/mol"),
+        (2.5, "nm", "angstrom"),
+    ]:
+        expected = convert(f"{value} {src}", dst).magnitude
+        assert convert_fast(value, src, dst) == pytest.approx(expected)
+
+
+def test_convert_fast_offset_units():
+    """Test the fast path on offset units (temperatures), both ways."""
+    assert convert_fast(25.0, "degC", "K") == pytest.approx(298.15)
+    assert convert_fast(298.15, "K", "degC") == pytest.approx(25.0)
+    assert convert_fast(32.0, "degF", "degC") == pytest.approx(0.0)
+    assert convert_fast(100.0, "degC", "degF") == pytest.approx(212.0)
+
+
+def test_convert_fast_repeated_calls():
+    """Test that the cached factors stay correct across calls."""
+    first = convert_fast(1.0, "kcal/mol", "J/mol")
+    second = convert_fast(2.0, "kcal/mol", "J/mol")
+    assert second == pytest.approx(2 * first)
+
+
 def test_concentration_units():
     """Test concentration units."""
     q = parse_quantity("5 mmol/L")
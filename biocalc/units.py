@@ -2,16 +2,61 @@
 Unit parsing, conversion, and validation using Pint.
 """
 
-from pint import UnitRegistry, DimensionalityError
-from .constants import CONSTANTS
+import functools
 
-# Shared unit registry instance
-ureg = UnitRegistry()
+from pint import DimensionalityError
+from .constants import CONSTANTS, ureg
+
+# The registry is shared with the constants module: a second
+# UnitRegistry would re-load the full default definitions file at import
+# and produce Quantities incompatible with the constants' registry.
 
 # Enable parsing of expressions with implicit multiplication
 ureg.default_format = "~P"
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_expr(expr):
+    """Parse an expression through the registry, cached per string.
+
+    Unit strings in this codebase come from a small fixed vocabulary, so
+    repeated conversions hit the cache instead of Pint's tokenizer.
+    Quantities are immutable with respect to their units, making the
+    shared cached object safe for read-only use.
+    """
+    return ureg.parse_expression(expr)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_unit(unit_str):
+    """Parse a unit string through the registry, cached per string."""
+    return ureg(unit_str)
+
+
+@functools.lru_cache(maxsize=64)
+def _dim(dimension_str):
+    """Resolve a dimension string like "[energy]/[substance]" to a
+    UnitsContainer, cached per string."""
+    return ureg.parse_expression(f"1 {dimension_str}").dimensionality
+
+
+@functools.lru_cache(maxsize=1)
+def _compat_index():
+    """Build the dimensionality -> unit names index, once on first use.
+
+    Replaces the per-call dir(ureg)/getattr scan in compatible_units with
+    a single walk over the registry's unit definitions.
+    """
+    index = {}
+    for name in ureg._units:
+        try:
+            dim = ureg.get_dimensionality(name)
+        except Exception:
+            continue
+        index.setdefault(dim, []).append(name)
+    return index
+
+
 def convert(value_expr, target_unit):
     """
     Convert a value expression to a target unit.
@@ -38,18 +83,61 @@ def convert(value_expr, target_unit):
     """
     # Parse the value if it's a string
     if isinstance(value_expr, str):
-        value = ureg.parse_expression(value_expr)
+        value = _parse_expr(value_expr)
     else:
         value = value_expr
-    
-    # Convert to target unit
-    try:
-        result = value.to(target_unit)
-        return result
-    except DimensionalityError as e:
+
+    # Check compatibility up front so the happy path raises nothing
+    target = _parse_unit(target_unit)
+    if value.dimensionality != target.dimensionality:
         raise ValueError(
-            f"Cannot convert {value.dimensionality} to {ureg(target_unit).dimensionality}"
-        ) from e
+            f"Cannot convert {value.dimensionality} to {target.dimensionality}"
+        )
+
+    return value.to(target_unit)
+
+
+# Lazily-filled (src_unit, dst_unit) -> (scale, offset) table backing the
+# scalar fast path in convert_fast
+_FAST_FACTORS = {}
+
+
+def convert_fast(value, src_unit, dst_unit):
+    """
+    Convert a plain number between units without building a Quantity.
+
+    The linear conversion (scale and offset) for each unit pair is
+    computed once via Pint and cached, so hot loops pay only a float
+    multiply-add per call. Use convert() when a unit-carrying result
+    is needed.
+
+    Parameters
+    ----------
+    value : float
+        Numeric value in source units
+    src_unit : str
+        Source unit like "kcal/mol"
+    dst_unit : str
+        Target unit like "J/mol"
+
+    Returns
+    -------
+    float
+        Converted magnitude
+
+    Examples
+    --------
+    >>> convert_fast(1.0, "kcal/mol", "J/mol")
+    4184.0
+    """
+    key = (src_unit, dst_unit)
+    try:
+        factor, offset = _FAST_FACTORS[key]
+    except KeyError:
+        offset = _parse_expr(f"0 {src_unit}").to(dst_unit).magnitude
+        factor = _parse_expr(f"1 {src_unit}").to(dst_unit).magnitude - offset
+        _FAST_FACTORS[key] = (factor, offset)
+    return value * factor + offset
 
 
 def parse_quantity(expr):
@@ -74,8 +162,11 @@ def parse_quantity(expr):
     >>> parse_quantity("2.1e-9 m^2/s")
     2.1e-9 m^2/s
     """
+    if not expr or not isinstance(expr, str):
+        raise ValueError(f"Cannot parse quantity '{expr}': expected a non-empty string")
+
     try:
-        return ureg.parse_expression(expr)
+        return _parse_expr(expr)
     except Exception as e:
         raise ValueError(f"Cannot parse quantity '{expr}': {e}") from e
 
@@ -102,8 +193,7 @@ def check_dimensionality(quantity, expected_dimension):
     >>> check_dimensionality(q, "[energy]/[substance]")
     True
     """
-    expected = ureg.parse_expression(f"1 {expected_dimension}")
-    return quantity.dimensionality == expected.dimensionality
+    return quantity.dimensionality == _dim(expected_dimension)
 
 
 def strip_units(quantity):
@@ -118,9 +208,9 @@ def strip_units(quantity):
     Returns
     -------
     float
-        Magnitude without units
+        Magnitude without units (non-Quantity inputs pass through)
     """
-    return quantity.magnitude
+    return getattr(quantity, "_magnitude", quantity)
 
 
 def add_units(value, unit_str):
@@ -190,7 +280,42 @@ def format_quantity(quantity, precision=3):
     >>> format_quantity(ureg.Quantity(4184.0, "J/mol"), precision=2)
     '4184.00 J/mol'
     """
-    return f"{quantity.magnitude:.{precision}f} {quantity.units:~P}"
+    return _fmt_template(quantity.units, precision).format(quantity.magnitude)
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_template(units, precision):
+    """Build a magnitude template with the pretty-printed unit suffix
+    baked in, cached per (units, precision).
+
+    Pint's '~P' unit formatting walks the whole UnitsContainer; units are
+    stable across calls, so the walk only needs to happen once per unit.
+    """
+    return f"{{:.{precision}f}} {units:~P}"
+
+
+@functools.lru_cache(maxsize=1024)
+def format_constant(name, precision=3):
+    """
+    Format a named constant for display, cached per (name, precision).
+
+    Constants are immutable for the program lifetime, so repeated listing
+    and search commands reuse the formatted string instead of paying
+    pint's formatting cost again.
+
+    Parameters
+    ----------
+    name : str
+        Constant name (key in CONSTANTS)
+    precision : int
+        Number of decimal places
+
+    Returns
+    -------
+    str
+        Formatted string
+    """
+    return format_quantity(CONSTANTS[name], precision)
 
 
 def compatible_units(unit_str):
@@ -213,21 +338,8 @@ def compatible_units(unit_str):
     ['kJ/mol', 'kcal/mol', 'eV', ...]
     """
     try:
-        unit = ureg(unit_str)
-        dimensionality = unit.dimensionality
-        
-        # Get all units with matching dimensionality
-        compatible = []
-        for name in dir(ureg):
-            if name.startswith('_'):
-                continue
-            try:
-                u = getattr(ureg, name)
-                if hasattr(u, 'dimensionality') and u.dimensionality == dimensionality:
-                    compatible.append(name)
-            except:
-                pass
-        
-        return compatible
-    except:
+        dimensionality = _parse_unit(unit_str).dimensionality
+    except (DimensionalityError, AttributeError, ValueError, KeyError):
         return []
+
+    return list(_compat_index().get(dimensionality, []))
@@ -2,10 +2,16 @@
 Parameter Sweep Demonstration
 
 Shows how to perform parameter sweeps and visualize the results.
+
+The sweep packs all parameter values into one batched ODE system: the
+right-hand side is built once with the rate constant as a per-trajectory
+parameter, and a single solve_ivp call integrates every trajectory at
+once instead of rebuilding the kinetic system per value.
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.integrate import solve_ivp
 from kinetics_playground.api import ReactionNetwork
 
 # Create simple reversible reaction
@@ -18,22 +24,38 @@ network = ReactionNetwork(reactions)
 
 # Parameter sweep: vary forward rate constant
 k_values = np.logspace(-2, 1, 20)  # 0.01 to 10
-final_B = []
-
-for k in k_values:
-    # Update rate constant
-    network.model.reactions[0].rate_constant = k
-    network._rebuild_kinetic_system()
-    
-    # Simulate
-    result = network.simulate(
-        initial_conditions={'A': 1.0, 'B': 0.0},
-        time_span=(0, 100),
-        num_points=1000
+k_reverse = network.model.reactions[1].rate_constant
+
+
+def sweep(k_values):
+    """Run the whole sweep in one integration; return final [B] per k."""
+
+    def batched_rhs(t, y):
+        """Batched RHS: one (num_k, 2) block of [A, B] per swept k value."""
+        Y = y.reshape(-1, 2)
+        forward = k_values * Y[:, 0]    # A -> B at each swept k
+        backward = k_reverse * Y[:, 1]  # B -> A
+        dY = np.empty_like(Y)
+        dY[:, 0] = backward - forward
+        dY[:, 1] = forward - backward
+        return dY.ravel()
+
+    # Initial conditions replicated across the batch: A = 1.0, B = 0.0
+    y0 = np.tile([1.0, 0.0], len(k_values))
+
+    solution = solve_ivp(
+        batched_rhs,
+        (0, 100),
+        y0,
+        t_eval=np.linspace(0, 100, 1000),
+        method='LSODA'
     )
-    
-    # Store final concentration of B
-    final_B.append(result.get_species('B')[-1])
+
+    # Final concentration of B for each swept k, as a numpy slice
+    return solution.y[1::2, -1]
+
+
+final_B = sweep(k_values)
 
 # Plot results
 plt.figure(figsize=(10, 6))
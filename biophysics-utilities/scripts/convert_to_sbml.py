@@ -25,15 +25,8 @@ def main():
     parser = ReactionParser()
     reactions = parser.parse_from_file(input_file)
     
-    # Create network
-    network = ReactionNetwork()
-    for rxn in reactions:
-        network.model.add_reaction(
-            reactants=rxn.reactants,
-            products=rxn.products,
-            rate_constant=rxn.rate_constant,
-            reversible=rxn.reversible
-        )
+    # Create network via the bulk loader (no per-reaction re-parsing)
+    network = ReactionNetwork.from_parsed(reactions)
     
     print(f"Loaded {len(reactions)} reactions")
     print(f"Species: {', '.join(network.get_species_names())}")
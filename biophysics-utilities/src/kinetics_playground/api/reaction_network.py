@@ -4,20 +4,77 @@ High-level ReactionNetwork API for easy model construction and simulation.
 This is the main user-facing interface for the kinetics playground.
 """
 
+import contextlib
+import functools
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+from scipy.integrate import solve_ivp
 from typing import List, Dict, Optional, Union, Tuple
 from kinetics_playground.core.parser import ReactionParser, ParsedReaction
 from kinetics_playground.core.model import ReactionModel
-from kinetics_playground.core.kinetics import KineticSystem, KineticLaw
+from kinetics_playground.core.kinetics import KineticSystem, KineticLaw, MassActionKinetics
 from kinetics_playground.core.integrator import ODEIntegrator, IntegrationResult
 from kinetics_playground.core.validator import ReactionValidator
 from kinetics_playground.core.stoichiometry import StoichiometricMatrix
-from kinetics_playground.visualization.plotter import Plotter
 from kinetics_playground.utils.logger import get_logger
 
 logger = get_logger()
 
 
+@functools.lru_cache(maxsize=8)
+def _time_grid(time_span, num_points):
+    """
+    Shared evaluation grid for a (time_span, num_points) pair.
+
+    Sweeps call simulate() with identical time settings N times; caching
+    the linspace avoids N allocations of the same array. The grid is
+    marked read-only since it is shared between results.
+    """
+    t_eval = np.linspace(time_span[0], time_span[1], num_points)
+    t_eval.setflags(write=False)
+    return t_eval
+
+
+# Per-worker sweep state, set up once by the pool initializer so the
+# pickled model crosses the process boundary once per worker rather than
+# once per task
+_sweep_state = None
+
+
+def _init_sweep_worker(model_bytes, parameter, initial_conditions, kwargs):
+    """Pool initializer: rehydrate the model and stash the sweep context."""
+    global _sweep_state
+    network = ReactionNetwork()
+    network.model = pickle.loads(model_bytes)
+    _sweep_state = (network, parameter, initial_conditions, kwargs)
+
+
+def _sweep_worker(value):
+    """
+    Run a single parameter-sweep point in a worker process.
+
+    Top-level function so ProcessPoolExecutor can pickle it. The network
+    was rehydrated once by _init_sweep_worker; each task only carries
+    its swept value, applies the one parameter change, and returns the
+    IntegrationResult.
+    """
+    network, parameter, initial_conditions, kwargs = _sweep_state
+
+    if parameter.startswith('k_'):
+        rxn_idx = int(parameter.split('_')[1])
+        network.model.reactions[rxn_idx].rate_constant = value
+        ic = initial_conditions
+    else:
+        ic = initial_conditions.copy()
+        ic[parameter] = value
+
+    network._rebuild_kinetic_system()
+    kwargs.setdefault('quiet', True)
+    return network.simulate(ic, **kwargs)
+
+
 class ReactionNetwork:
     """
     High-level interface for reaction network construction and simulation.
@@ -61,16 +118,83 @@ class ReactionNetwork:
         self.kinetic_system = None
         self.stoichiometric_matrix = None
         self.parser = ReactionParser()
-        
+
+        # Cached numerical RHS, keyed on the model state that affects it.
+        # Re-lambdifying/compiling per simulate() call can exceed the
+        # integration cost itself in long sweeps.
+        self._dydt_cache = None
+        self._dydt_cache_key = None
+
+        # Cached analytic Jacobian for the implicit solver methods
+        self._jac_cache = None
+        self._jac_cache_key = None
+
+        # True while parameter_sweep's rate-ref RHS is installed; the
+        # analytic Jacobian is skipped then, since it would be built
+        # from the model's (un-swept) rate constants
+        self._rate_ref_active = False
+
+        # Nesting depth of batch_update(); rebuilds are deferred while > 0
+        self._batch_depth = 0
+
         if reactions is not None:
             self.add_reactions(reactions)
     
-    def add_reactions(self, reactions: Union[str, List[str], dict]):
+    @classmethod
+    def from_parsed(
+        cls,
+        reactions: List[ParsedReaction],
+        name: str = "reaction_network"
+    ) -> "ReactionNetwork":
+        """
+        Build a network directly from ParsedReaction objects.
+
+        Bulk-loading path for callers that already hold parser output
+        (e.g. file converters): species are registered in one pass,
+        reactions are appended without going back through the string
+        parser, and the kinetic system is rebuilt once at the end
+        instead of per reaction.
+
+        Args:
+            reactions: List of ParsedReaction objects
+            name: Network name
+
+        Returns:
+            ReactionNetwork instance
+        """
+        network = cls(name=name)
+        model = network.model
+
+        # First pass: register every species once
+        for parsed_rxn in reactions:
+            for species_name in parsed_rxn.reactants.keys() | parsed_rxn.products.keys():
+                model.add_species(species_name)
+
+        # Second pass: append reactions
+        for parsed_rxn in reactions:
+            model.add_reaction(
+                reactants=parsed_rxn.reactants,
+                products=parsed_rxn.products,
+                rate_constant=parsed_rxn.rate_constant,
+                reversible=parsed_rxn.reversible,
+                kinetic_law=parsed_rxn.kinetic_law,
+                parameters=parsed_rxn.parameters
+            )
+
+        # Single rebuild for the whole batch
+        network._rebuild_kinetic_system()
+
+        logger.info(f"Built network from {len(reactions)} parsed reaction(s)")
+        return network
+
+    def add_reactions(self, reactions: Union[str, List[str], List[ParsedReaction], dict]):
         """
         Add reactions to the network.
-        
+
         Args:
-            reactions: Reactions to add
+            reactions: Reactions to add. Lists of ParsedReaction objects
+                (e.g. from ReactionParser.parse_from_file) are taken
+                as-is without a second pass through the string parser.
         """
         # Parse reactions
         if isinstance(reactions, str):
@@ -79,7 +203,10 @@ class ReactionNetwork:
             else:
                 parsed = [self.parser.parse_single(reactions)]
         elif isinstance(reactions, list):
-            parsed = self.parser.parse_multiple(reactions)
+            if reactions and isinstance(reactions[0], ParsedReaction):
+                parsed = reactions
+            else:
+                parsed = self.parser.parse_multiple(reactions)
         else:
             raise TypeError(f"Unsupported reaction format: {type(reactions)}")
         
@@ -94,10 +221,35 @@ class ReactionNetwork:
                 parameters=parsed_rxn.parameters
             )
         
-        # Rebuild kinetic system
-        self._rebuild_kinetic_system()
-        
+        # Rebuild kinetic system (deferred inside batch_update blocks)
+        if self._batch_depth == 0:
+            self._rebuild_kinetic_system()
+
         logger.info(f"Added {len(parsed)} reaction(s) to network")
+
+    @contextlib.contextmanager
+    def batch_update(self):
+        """
+        Defer kinetic-system rebuilds until the block exits.
+
+        Each add_reactions call normally rebuilds the kinetic system, so
+        assembling a large network from R separate calls costs R
+        rebuilds. Inside this context the rebuilds are suppressed and a
+        single one runs on exit; nesting is safe, with the rebuild
+        happening when the outermost block closes.
+
+        Example:
+            >>> with network.batch_update():
+            ...     network.add_reactions("A -> B ; 0.1")
+            ...     network.add_reactions("B -> C ; 0.2")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._rebuild_kinetic_system()
     
     def set_initial_conditions(self, initial_conditions: Dict[str, float]):
         """
@@ -121,6 +273,9 @@ class ReactionNetwork:
             self._rebuild_kinetic_system()
         
         self.kinetic_system.set_kinetic_law(reaction_index, kinetic_law)
+        # A new law changes the RHS without touching the cache key inputs
+        self._dydt_cache_key = None
+        self._jac_cache_key = None
     
     def simulate(
         self,
@@ -128,18 +283,30 @@ class ReactionNetwork:
         time_span: Tuple[float, float] = (0, 100),
         num_points: int = 1000,
         method: str = 'LSODA',
+        use_numba: bool = True,
+        quiet: bool = False,
         **kwargs
     ) -> IntegrationResult:
         """
         Run simulation.
-        
+
         Args:
             initial_conditions: Initial concentrations (uses model defaults if None)
             time_span: (t_start, t_end) tuple
             num_points: Number of time points to evaluate
             method: Integration method ('RK45', 'LSODA', 'BDF', etc.)
+            use_numba: Compile the RHS with Numba when available (the
+                'performance' extra). Compiled RHS evaluation avoids
+                interpreter overhead on every solver step; set False to
+                force the pure-Python/sympy path, e.g. when debugging a
+                kinetic law. Falls back automatically if Numba is not
+                installed or a custom law is in use.
+            quiet: Suppress the per-run logger calls. Used by sweeps,
+                where hundreds of start/end log records (and their
+                string formatting) add measurable overhead to the hot
+                loop; the sweep emits aggregate progress instead.
             **kwargs: Additional arguments for integrator
-            
+
         Returns:
             IntegrationResult object
         """
@@ -154,9 +321,24 @@ class ReactionNetwork:
         if self.kinetic_system is None:
             self._rebuild_kinetic_system()
         
-        # Create numerical function
-        dydt = self.kinetic_system.to_numerical_function()
-        
+        # Create numerical function (Numba-compiled when available, with
+        # transparent fallback to the lambdified version), reusing the
+        # cached one when the model is unchanged since the last call
+        dydt = self._get_dydt(use_numba=use_numba)
+
+        # Analytic Jacobian for the implicit methods, so the solver does
+        # not fall back to finite-difference estimates (N+1 extra RHS
+        # calls per Jacobian refresh). Skipped while a sweep's rate-ref
+        # RHS is installed: the Jacobian would be lambdified from the
+        # model's rate constants, not the swept ones, so the solver
+        # must finite-difference the live RHS instead.
+        if (
+            method in ODEIntegrator.IMPLICIT_METHODS
+            and 'jac' not in kwargs
+            and not self._rate_ref_active
+        ):
+            kwargs['jac'] = self._get_jac()
+
         # Create integrator
         integrator = ODEIntegrator(
             dydt=dydt,
@@ -165,17 +347,19 @@ class ReactionNetwork:
             **kwargs
         )
         
-        # Time points
-        t_eval = np.linspace(time_span[0], time_span[1], num_points)
+        # Time points (cached across calls with the same settings)
+        t_eval = _time_grid(tuple(time_span), num_points)
         
         # Integrate
-        logger.info(f"Starting simulation: t={time_span[0]} to {time_span[1]}")
+        if not quiet:
+            logger.info(f"Starting simulation: t={time_span[0]} to {time_span[1]}")
         result = integrator.integrate(y0, time_span, t_eval=t_eval)
-        
-        if result.success:
-            logger.info("Simulation completed successfully")
-        else:
-            logger.warning(f"Simulation issue: {result.message}")
+
+        if not quiet:
+            if result.success:
+                logger.info("Simulation completed successfully")
+            else:
+                logger.warning(f"Simulation issue: {result.message}")
         
         return result
     
@@ -184,54 +368,245 @@ class ReactionNetwork:
         parameter: str,
         values: np.ndarray,
         initial_conditions: Dict[str, float],
+        n_workers: Optional[int] = None,
+        batched: bool = False,
         **kwargs
     ) -> List[IntegrationResult]:
         """
         Perform parameter sweep.
-        
+
         Args:
             parameter: Parameter name (e.g., rate constant "k_0")
             values: Array of parameter values to sweep
             initial_conditions: Initial conditions for all runs
+            n_workers: Number of worker processes. Each sweep point is
+                independent, so with n_workers > 1 the simulations are
+                dispatched across a process pool (near-linear speedup up
+                to min(len(values), cores); the 'fork' start method on
+                Linux avoids re-importing heavy modules per worker).
+                None or 1 keeps the serial in-process path.
+            batched: Stack all sweep points into one (N * num_species)
+                state vector and integrate them with a single solve_ivp
+                call instead of N separate solves. Cuts per-solve Python
+                and setup overhead, which dominates for small networks.
+                Requires pure mass-action kinetics; falls back to the
+                serial path otherwise.
             **kwargs: Additional arguments for simulate()
-            
+
         Returns:
-            List of IntegrationResult objects
+            List of IntegrationResult objects, in the order of `values`
         """
+        if not (parameter.startswith('k_') or parameter in self.model._species_map):
+            raise ValueError(f"Unknown parameter: {parameter}")
+
+        # Sweeps run quiet by default; setdefault (rather than a
+        # quiet=True at each call site) lets callers override it
+        # without a duplicate-keyword TypeError
+        kwargs.setdefault('quiet', True)
+
+        if batched:
+            results = self._batched_sweep(
+                parameter, values, initial_conditions, kwargs
+            )
+            if results is not None:
+                logger.info(f"Parameter sweep complete: {len(values)} simulations")
+                return results
+            # Non-mass-action kinetics: continue on the per-point paths
+
+        if n_workers is not None and n_workers > 1:
+            results = self._parallel_sweep(
+                parameter, values, initial_conditions, n_workers, kwargs
+            )
+            logger.info(f"Parameter sweep complete: {len(values)} simulations")
+            return results
+
         results = []
-        original_value = None
-        
+        # Aggregate progress instead of per-run logging in the hot loop
+        log_every = max(1, len(values) // 20)
+
+        def _progress(done):
+            if done % log_every == 0:
+                logger.info(f"Parameter sweep progress: {done}/{len(values)}")
+
         # Determine what parameter to sweep
         if parameter.startswith('k_'):
             # Rate constant
             rxn_idx = int(parameter.split('_')[1])
-            original_value = self.model.reactions[rxn_idx].rate_constant
-            
-            for value in values:
-                # Temporarily change rate constant
-                self.model.reactions[rxn_idx].rate_constant = value
-                self._rebuild_kinetic_system()
-                
-                result = self.simulate(initial_conditions, **kwargs)
-                results.append(result)
-            
-            # Restore original
-            self.model.reactions[rxn_idx].rate_constant = original_value
-            self._rebuild_kinetic_system()
-        
-        elif parameter in self.model._species_map:
+
+            built = self._build_dydt_with_rate_refs()
+            if built is not None:
+                # Mass-action fast path: the RHS reads rate constants
+                # from a mutable array, so stepping the swept value is a
+                # single element write instead of a full rebuild
+                dydt, rate_array = built
+                self._dydt_cache = dydt
+                # Seed the key with the use_numba value simulate() will
+                # look it up with, otherwise a use_numba=False sweep
+                # rebuilds (and then pins) an RHS at the un-swept rates
+                self._dydt_cache_key = self._dydt_key(kwargs.get('use_numba', True))
+                self._rate_ref_active = True
+                try:
+                    for value in values:
+                        rate_array[rxn_idx] = value
+                        result = self.simulate(initial_conditions, **kwargs)
+                        results.append(result)
+                        _progress(len(results))
+                finally:
+                    # The rate-ref RHS is sweep-local; drop it so the
+                    # next simulate() rebuilds from the model's values
+                    self._dydt_cache_key = None
+                    self._rate_ref_active = False
+            else:
+                original_value = self.model.reactions[rxn_idx].rate_constant
+
+                try:
+                    for value in values:
+                        # Temporarily change rate constant; topology is
+                        # untouched, so keep the stoichiometric matrix
+                        self.model.reactions[rxn_idx].rate_constant = value
+                        self._rebuild_kinetic_system(structural_change=False)
+
+                        result = self.simulate(initial_conditions, **kwargs)
+                        results.append(result)
+                        _progress(len(results))
+                finally:
+                    # Restore original
+                    self.model.reactions[rxn_idx].rate_constant = original_value
+                    self._rebuild_kinetic_system(structural_change=False)
+
+        else:
             # Initial concentration sweep
             for value in values:
                 ic = initial_conditions.copy()
                 ic[parameter] = value
                 result = self.simulate(ic, **kwargs)
                 results.append(result)
-        
-        else:
-            raise ValueError(f"Unknown parameter: {parameter}")
-        
+                _progress(len(results))
+
         logger.info(f"Parameter sweep complete: {len(values)} simulations")
         return results
+
+    def _parallel_sweep(
+        self,
+        parameter: str,
+        values: np.ndarray,
+        initial_conditions: Dict[str, float],
+        n_workers: int,
+        kwargs: Dict
+    ) -> List[IntegrationResult]:
+        """
+        Run the sweep points across a process pool.
+
+        The model is pickled once and handed to each worker through the
+        pool initializer, so tasks carry only their swept value; nothing
+        here mutates self. Results come back in submission order via
+        executor.map.
+        """
+        model_bytes = pickle.dumps(self.model)
+        chunksize = max(1, len(values) // (4 * n_workers))
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_sweep_worker,
+            initargs=(model_bytes, parameter, initial_conditions, kwargs)
+        ) as executor:
+            return list(executor.map(_sweep_worker, values, chunksize=chunksize))
+
+    def _batched_sweep(
+        self,
+        parameter: str,
+        values: np.ndarray,
+        initial_conditions: Dict[str, float],
+        kwargs: Dict
+    ) -> Optional[List[IntegrationResult]]:
+        """
+        Integrate all sweep points as one stacked ODE system.
+
+        The N independent copies of the network are packed into a single
+        (N * num_species) state vector; the batched RHS reshapes to
+        (N, num_species), evaluates every copy's mass-action rates with
+        one broadcasted power/product and one GEMM against the
+        stoichiometric matrix, and ravels back. One solve_ivp call then
+        integrates every trajectory at once.
+
+        Only valid for mass-action kinetics, where the swept parameter
+        enters the rates linearly (rate constant) or via the initial
+        state: returns None for anything else so callers can fall back
+        to the per-point paths.
+        """
+        if self.kinetic_system is None:
+            self._rebuild_kinetic_system()
+
+        if not all(isinstance(law, MassActionKinetics)
+                   for law in self.kinetic_system.kinetic_laws.values()):
+            return None
+
+        # Everything beyond the simulate()-level settings is a solver
+        # kwarg and must reach solve_ivp, otherwise batched sweeps
+        # silently run at default tolerances. A caller-supplied jac or
+        # vectorized flag is shaped for the single system, not the
+        # stacked one, so those fall back to the per-point paths.
+        solver_kwargs = {
+            key: val for key, val in kwargs.items()
+            if key not in ('time_span', 'num_points', 'method',
+                           'use_numba', 'quiet')
+        }
+        if 'jac' in solver_kwargs or 'vectorized' in solver_kwargs:
+            return None
+        # Match the per-point path's ODEIntegrator defaults, which are
+        # tighter than solve_ivp's own
+        solver_kwargs.setdefault('rtol', 1e-6)
+        solver_kwargs.setdefault('atol', 1e-9)
+
+        S, E, k = self.kinetic_system._mass_action_arrays()
+        num_species = self.model.num_species()
+        n = len(values)
+
+        # Per-copy rate constants: only a rate-constant sweep varies them
+        k_batch = np.tile(k, (n, 1))
+
+        self.set_initial_conditions(initial_conditions)
+        y0_single = self.model.get_initial_concentrations()
+        y0 = np.tile(y0_single, n)
+
+        if parameter.startswith('k_'):
+            rxn_idx = int(parameter.split('_')[1])
+            k_batch[:, rxn_idx] = values
+        else:
+            species_idx = self.model.get_species_index(parameter)
+            y0 = y0.reshape(n, num_species)
+            y0[:, species_idx] = values
+            y0 = y0.ravel()
+
+        St = S.T
+
+        def dydt_batch(t, y):
+            Y = y.reshape(n, num_species)
+            # (N, num_reactions) rate matrix in one broadcasted evaluation
+            V = k_batch * np.prod(Y[:, None, :] ** E[None, :, :], axis=2)
+            return (V @ St).ravel()
+
+        time_span = kwargs.get('time_span', (0, 100))
+        num_points = kwargs.get('num_points', 1000)
+        method = kwargs.get('method', 'LSODA')
+        t_eval = _time_grid(tuple(time_span), num_points)
+
+        logger.info(f"Starting batched sweep: {n} systems in one integration")
+        sol = solve_ivp(dydt_batch, time_span, y0, method=method,
+                        t_eval=t_eval, **solver_kwargs)
+
+        species_names = self.model.get_species_names()
+        return [
+            IntegrationResult(
+                t=sol.t,
+                y=sol.y[i * num_species:(i + 1) * num_species, :],
+                success=sol.success,
+                message=sol.message,
+                nfev=sol.nfev,
+                species_names=species_names.copy()
+            )
+            for i in range(n)
+        ]
     
     def validate(self, raise_on_error: bool = False) -> List:
         """
@@ -325,14 +700,85 @@ class ReactionNetwork:
             result: IntegrationResult from simulate()
             **kwargs: Additional plotting arguments
         """
+        # Deferred import: pulling in the plotter imports matplotlib
+        # (hundreds of ms and tens of MB), which non-plotting users of
+        # this module - including every CLI invocation - never need
+        from kinetics_playground.visualization.plotter import Plotter
+
         plotter = Plotter()
         plotter.plot_time_course(result, **kwargs)
         plotter.show()
     
-    def _rebuild_kinetic_system(self):
-        """Rebuild kinetic system after model changes."""
+    def _get_dydt(self, use_numba: bool = True):
+        """
+        Get the numerical RHS, rebuilding only when the model changed.
+
+        The cache key covers everything to_compiled_function depends on
+        for a fixed model object: the rate constants and the species
+        count. Structural changes go through _rebuild_kinetic_system,
+        which drops the key outright.
+        """
+        key = self._dydt_key(use_numba)
+        if key != self._dydt_cache_key:
+            if use_numba:
+                self._dydt_cache = self.kinetic_system.to_compiled_function()
+            else:
+                self._dydt_cache = self.kinetic_system.to_numerical_function()
+            self._dydt_cache_key = key
+        return self._dydt_cache
+
+    def _get_jac(self):
+        """Get the analytic Jacobian, rebuilding only when the model changed."""
+        key = self._dydt_key()
+        if key != self._jac_cache_key:
+            self._jac_cache = self.kinetic_system.to_jacobian_function()
+            self._jac_cache_key = key
+        return self._jac_cache
+
+    def _dydt_key(self, use_numba: bool = True):
+        """Cache key for the numerical RHS: the model state it depends on."""
+        return (
+            id(self.model),
+            tuple(r.rate_constant for r in self.model.reactions),
+            self.model.num_species(),
+            use_numba,
+        )
+
+    def _build_dydt_with_rate_refs(self) -> Optional[Tuple]:
+        """
+        Build a mass-action RHS that reads rate constants by reference.
+
+        Instead of baking the rate constants into generated code, the
+        returned function closes over a mutable (num_reactions,) NumPy
+        array; writing an element updates the RHS in place with no
+        re-lambdification. Used by parameter_sweep to step the swept
+        constant between integrations.
+
+        Returns:
+            (dydt, rate_array) tuple, or None when any reaction uses a
+            non-mass-action kinetic law
+        """
+        if self.kinetic_system is None:
+            self._rebuild_kinetic_system()
+
+        return self.kinetic_system.to_vectorized_function()
+
+    def _rebuild_kinetic_system(self, structural_change: bool = True):
+        """
+        Rebuild kinetic system after model changes.
+
+        Args:
+            structural_change: Whether the reaction topology changed.
+                The stoichiometric matrix depends only on topology, so
+                rate-constant-only rebuilds (structural_change=False,
+                e.g. from parameter sweeps) keep the cached matrix for
+                analyses interleaved with the sweep.
+        """
         self.kinetic_system = KineticSystem(self.model)
-        self.stoichiometric_matrix = None  # Invalidate cache
+        if structural_change:
+            self.stoichiometric_matrix = None  # Invalidate cache
+        self._dydt_cache_key = None
+        self._jac_cache_key = None
     
     def __repr__(self):
         return f"ReactionNetwork(species={self.model.num_species()}, reactions={self.model.num_reactions()})"
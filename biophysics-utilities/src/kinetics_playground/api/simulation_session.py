@@ -4,7 +4,10 @@ Simulation session for managing multiple related simulations.
 Useful for organizing parameter sweeps, sensitivity analysis, and comparative studies.
 """
 
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional
+
 import numpy as np
 from kinetics_playground.api.reaction_network import ReactionNetwork
 from kinetics_playground.core.integrator import IntegrationResult
@@ -13,6 +16,26 @@ from kinetics_playground.utils.logger import get_logger
 logger = get_logger()
 
 
+# Per-worker network, rehydrated once by the pool initializer instead of
+# shipping a pickled model with every task
+_worker_network = None
+
+
+def _init_session_worker(model_bytes):
+    """Pool initializer: rebuild the network once per worker process."""
+    global _worker_network
+    _worker_network = ReactionNetwork()
+    _worker_network.model = pickle.loads(model_bytes)
+    _worker_network._rebuild_kinetic_system()
+
+
+def _session_worker(task):
+    """Run one simulation on the worker's rehydrated network."""
+    initial_conditions, kwargs = task
+    kwargs.setdefault('quiet', True)
+    return _worker_network.simulate(initial_conditions, **kwargs)
+
+
 class SimulationSession:
     """
     Manages a collection of related simulations.
@@ -32,6 +55,74 @@ class SimulationSession:
         self.name = name
         self.results: List[IntegrationResult] = []
         self.metadata: List[Dict] = []
+
+        # Optional pre-allocated trajectory storage (see preallocate())
+        self._trajectories: Optional[np.ndarray] = None
+        self._times: Optional[np.ndarray] = None
+        self._buffer_count = 0
+
+        # Inverted metadata index: key -> value -> result indices, so
+        # get_results filters by intersecting small index lists instead
+        # of scanning every stored simulation
+        self._meta_index: Dict[str, Dict] = {}
+
+    def preallocate(self, n_sims: int, n_species: int, n_points: int):
+        """
+        Pre-allocate contiguous storage for upcoming simulations.
+
+        Stored trajectories land in one (n_sims, n_species, n_points)
+        float64 block instead of only living in the per-result list, so
+        post-sweep statistics (means, quantiles, reductions over the
+        sweep axis) can run vectorized without stacking thousands of
+        result arrays first. Simulations whose shape does not match the
+        buffer, or that arrive after it is full, are still recorded in
+        self.results but skipped here.
+
+        Args:
+            n_sims: Number of simulations to reserve space for
+            n_species: Number of species per simulation
+            n_points: Number of time points per simulation
+        """
+        self._trajectories = np.empty((n_sims, n_species, n_points), dtype=np.float64)
+        self._times = np.empty((n_sims, n_points), dtype=np.float64)
+        self._buffer_count = 0
+
+    @property
+    def trajectories(self) -> Optional[np.ndarray]:
+        """Filled portion of the pre-allocated (sim, species, time) buffer."""
+        if self._trajectories is None:
+            return None
+        return self._trajectories[:self._buffer_count]
+
+    @property
+    def times(self) -> Optional[np.ndarray]:
+        """Filled portion of the pre-allocated (sim, time) buffer."""
+        if self._times is None:
+            return None
+        return self._times[:self._buffer_count]
+
+    def _store(self, result: IntegrationResult, metadata: Dict):
+        """Record a result, copying it into the buffer when one is active."""
+        self.results.append(result)
+        self.metadata.append(metadata)
+
+        idx = len(self.results) - 1
+        for key, value in metadata.items():
+            try:
+                self._meta_index.setdefault(key, {}).setdefault(value, []).append(idx)
+            except TypeError:
+                # Unhashable metadata value: left out of the index;
+                # get_results falls back to scanning for such queries
+                pass
+
+        if (
+            self._trajectories is not None
+            and self._buffer_count < self._trajectories.shape[0]
+            and result.y.shape == self._trajectories.shape[1:]
+        ):
+            self._trajectories[self._buffer_count] = result.y
+            self._times[self._buffer_count] = result.t
+            self._buffer_count += 1
     
     def add_simulation(
         self,
@@ -51,10 +142,9 @@ class SimulationSession:
             IntegrationResult
         """
         result = self.network.simulate(initial_conditions, **kwargs)
-        
-        self.results.append(result)
-        self.metadata.append(metadata or {})
-        
+
+        self._store(result, metadata or {})
+
         return result
     
     def parameter_sweep(
@@ -82,8 +172,7 @@ class SimulationSession:
         
         # Store results with metadata
         for value, result in zip(values, results):
-            self.results.append(result)
-            self.metadata.append({
+            self._store(result, {
                 'type': 'parameter_sweep',
                 'parameter': parameter,
                 'value': float(value)
@@ -96,41 +185,70 @@ class SimulationSession:
         self,
         base_initial_conditions: Dict[str, float],
         perturbation: float = 0.01,
+        n_workers: Optional[int] = None,
         **kwargs
     ) -> Dict[str, IntegrationResult]:
         """
         Perform sensitivity analysis on initial conditions.
-        
+
         Args:
             base_initial_conditions: Baseline initial conditions
             perturbation: Fractional perturbation
+            n_workers: Number of worker processes. Each perturbation is
+                an independent simulation, so with n_workers > 1 they
+                are dispatched across a process pool; the model is
+                shipped once per worker via the pool initializer rather
+                than per task. Small analyses (< 4 species) stay serial
+                since pool startup would dominate.
             **kwargs: Simulation arguments
-            
+
         Returns:
             Dict mapping species to perturbed results
         """
         sensitivities = {}
-        
+
         # Run baseline
         baseline = self.network.simulate(base_initial_conditions, **kwargs)
-        self.results.append(baseline)
-        self.metadata.append({'type': 'sensitivity_baseline'})
-        
-        # Perturb each species
-        for species in base_initial_conditions.keys():
+        self._store(baseline, {'type': 'sensitivity_baseline'})
+
+        species_list = list(base_initial_conditions.keys())
+        perturbed_ics = []
+        for species in species_list:
             perturbed_ic = base_initial_conditions.copy()
             perturbed_ic[species] *= (1.0 + perturbation)
-            
-            result = self.network.simulate(perturbed_ic, **kwargs)
+            perturbed_ics.append(perturbed_ic)
+
+        parallel = (
+            n_workers is not None and n_workers > 1
+            and len(base_initial_conditions) >= 4
+        )
+
+        if parallel:
+            model_bytes = pickle.dumps(self.network.model)
+            tasks = [(ic, kwargs) for ic in perturbed_ics]
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_session_worker,
+                initargs=(model_bytes,)
+            ) as executor:
+                perturbed_results = list(executor.map(_session_worker, tasks))
+        else:
+            quiet_kwargs = dict(kwargs)
+            quiet_kwargs.setdefault('quiet', True)
+            perturbed_results = [
+                self.network.simulate(ic, **quiet_kwargs)
+                for ic in perturbed_ics
+            ]
+
+        # Record results serially on the main process, in submission order
+        for species, result in zip(species_list, perturbed_results):
             sensitivities[species] = result
-            
-            self.results.append(result)
-            self.metadata.append({
+            self._store(result, {
                 'type': 'sensitivity_analysis',
                 'perturbed_species': species,
                 'perturbation': perturbation
             })
-        
+
         logger.info(f"Sensitivity analysis complete: {len(sensitivities)} perturbations")
         return sensitivities
     
@@ -144,40 +262,64 @@ class SimulationSession:
         Returns:
             List of matching results
         """
-        if filter_by is None:
+        if not filter_by:
             return self.results
-        
-        filtered = []
-        for result, meta in zip(self.results, self.metadata):
-            if all(meta.get(k) == v for k, v in filter_by.items()):
-                filtered.append(result)
-        
-        return filtered
+
+        try:
+            index_sets = [
+                set(self._meta_index.get(k, {}).get(v, ()))
+                for k, v in filter_by.items()
+            ]
+        except TypeError:
+            # Unhashable query value: fall back to the linear scan
+            return [
+                result
+                for result, meta in zip(self.results, self.metadata)
+                if all(meta.get(k) == v for k, v in filter_by.items())
+            ]
+
+        matching = set.intersection(*index_sets)
+        return [self.results[i] for i in sorted(matching)]
     
     def clear(self):
         """Clear all stored results and metadata."""
         self.results.clear()
         self.metadata.clear()
+        self._meta_index.clear()
+        self._buffer_count = 0
         logger.info("Session cleared")
     
     def export_all(self, directory: str, prefix: str = "sim"):
         """
         Export all results to CSV files.
-        
+
+        Files are written concurrently on a thread pool: CSV
+        serialization releases the GIL in pandas, so the writes overlap
+        with each other and with filesystem I/O instead of leaving the
+        disk idle between serial writes.
+
         Args:
             directory: Output directory
             prefix: Filename prefix
         """
+        import os
+        from concurrent.futures import ThreadPoolExecutor
         from pathlib import Path
         from kinetics_playground.utils.exporters import export_results_to_csv
-        
+
         output_dir = Path(directory)
         output_dir.mkdir(parents=True, exist_ok=True)
-        
-        for idx, result in enumerate(self.results):
+
+        def _write_one(task):
+            idx, result = task
             filename = output_dir / f"{prefix}_{idx:04d}.csv"
             export_results_to_csv(result, str(filename))
-        
+
+        max_workers = min(16, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # list() so worker exceptions propagate to the caller
+            list(executor.map(_write_one, enumerate(self.results)))
+
         logger.info(f"Exported {len(self.results)} results to {directory}")
     
     def summary(self) -> str:
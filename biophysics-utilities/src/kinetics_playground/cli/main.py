@@ -43,8 +43,7 @@ def presets():
 def preset(name, initial, time, plot):
     """Run a preset reaction network."""
     from kinetics_playground.api.presets import load_preset
-    import matplotlib.pyplot as plt
-    
+
     try:
         network = load_preset(name)
         click.echo(f"Loaded preset: {name}")
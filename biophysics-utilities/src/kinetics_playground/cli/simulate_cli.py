@@ -1,10 +1,29 @@
 """Simulation CLI commands."""
 
+import os
+from functools import lru_cache
+
 import click
 import json
 from pathlib import Path
 
 
+@lru_cache(maxsize=32)
+def _parse_file_cached(filepath, mtime):
+    """
+    Parse a reaction file, cached on (path, mtime).
+
+    Parsing is pure with respect to the file content, so repeated loads
+    of an unchanged file (e.g. programmatic sweeps driving
+    simulate_command in-process) skip the tokenizer and regex work; the
+    mtime key invalidates the entry when the file changes. Per-process
+    only - a persistent on-disk cache would need joblib, which is not a
+    project dependency.
+    """
+    from kinetics_playground.core.parser import ReactionParser
+    return ReactionParser().parse_from_file(filepath)
+
+
 @click.command()
 @click.option('--input', '-i', 'input_file', required=True, type=click.Path(exists=True),
               help='Input file with reactions (.yaml, .json, .txt)')
@@ -34,27 +53,12 @@ def simulate_command(input_file, initial, time, points, method, output, plot, ve
         set_log_level(logging.DEBUG)
     
     try:
-        # Load network
+        # Load network from the parsed reaction list; the constructor
+        # adds the reactions and rebuilds the kinetic system exactly once
         click.echo(f"Loading reactions from {input_file}...")
-        network = ReactionNetwork()
-        
-        # Parse file
-        from kinetics_playground.core.parser import ReactionParser
-        parser = ReactionParser()
-        reactions = parser.parse_from_file(input_file)
-        
-        for rxn in reactions:
-            network.model.add_reaction(
-                reactants=rxn.reactants,
-                products=rxn.products,
-                rate_constant=rxn.rate_constant,
-                reversible=rxn.reversible,
-                kinetic_law=rxn.kinetic_law,
-                parameters=rxn.parameters
-            )
-        
-        network._rebuild_kinetic_system()
-        
+        reactions = _parse_file_cached(input_file, os.path.getmtime(input_file))
+        network = ReactionNetwork(reactions=reactions)
+
         click.echo(f"Loaded {len(reactions)} reactions")
         click.echo(f"Species: {', '.join(network.get_species_names())}")
         
@@ -104,9 +108,8 @@ def simulate_command(input_file, initial, time, points, method, output, plot, ve
                 export_results_to_csv(result, output)
                 click.echo(f"\n✓ Results saved to {output}")
             
-            # Plot
+            # Plot (network.plot imports matplotlib on demand)
             if plot:
-                import matplotlib.pyplot as plt
                 network.plot(result)
         else:
             click.echo(f"✗ Simulation failed: {result.message}", err=True)
@@ -2,6 +2,40 @@
 
 import click
 
+# Lazily imported heavy modules, cached at module level so repeated
+# in-process invocations (tests, programmatic CLI use) pay the import
+# cost once instead of re-resolving it inside every command call
+_pd = None
+_plt = None
+
+
+def _get_pandas():
+    global _pd
+    if _pd is None:
+        import pandas
+        _pd = pandas
+    return _pd
+
+
+def _get_pyplot(interactive: bool):
+    """
+    Import and cache matplotlib.pyplot.
+
+    When no display is needed the Agg backend is selected before pyplot
+    loads, skipping GUI toolkit discovery and initialization entirely.
+    The backend choice sticks for the process, which is fine for the
+    CLI: it either saves files or shows windows, decided per invocation
+    before the first pyplot import.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib
+        if not interactive:
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
@@ -20,27 +54,42 @@ def visualize_command(input_file, species, phase, output, format, dpi):
         kinetics visualize results.csv -s A -s B
         kinetics visualize results.csv --phase A B -o plot.png
     """
-    import pandas as pd
-    import matplotlib.pyplot as plt
-    from kinetics_playground.visualization.plotter import Plotter
-    
+    import numpy as np
+
+    pd = _get_pandas()
+    plt = _get_pyplot(interactive=output is None)
+
     try:
-        # Load data
+        # Peek at the header first, then load only the columns the plot
+        # actually needs; species columns are read as float32, which is
+        # plenty for pixels and halves the parse and memory cost on
+        # wide result files
         click.echo(f"Loading data from {input_file}...")
-        df = pd.read_csv(input_file)
-        
-        # Get time and species
-        if 't' not in df.columns:
+        header = list(pd.read_csv(input_file, nrows=0).columns)
+
+        if 't' not in header:
             click.echo("Error: CSV must contain 't' column", err=True)
             raise click.Abort()
-        
+
+        available_species = [col for col in header if col != 't']
+
+        if phase:
+            needed = [c for c in phase if c in available_species]
+        elif species:
+            needed = [c for c in species if c in available_species]
+        else:
+            needed = available_species
+
+        df = pd.read_csv(
+            input_file,
+            usecols=['t'] + needed,
+            dtype={c: np.float32 for c in needed}
+        )
+
         t = df['t'].values
-        available_species = [col for col in df.columns if col != 't']
-        
+
         click.echo(f"Found {len(available_species)} species: {', '.join(available_species)}")
         
-        plotter = Plotter()
-        
         if phase:
             # Phase space plot
             species_x, species_y = phase
@@ -49,8 +98,9 @@ def visualize_command(input_file, species, phase, output, format, dpi):
                 click.echo(f"Error: Species not found in data", err=True)
                 raise click.Abort()
             
-            x = df[species_x].values
-            y = df[species_y].values
+            xy = df[[species_x, species_y]].to_numpy()
+            x = xy[:, 0]
+            y = xy[:, 1]
             
             fig, ax = plt.subplots(figsize=(8, 8))
             ax.plot(x, y, linewidth=2)
@@ -65,18 +115,41 @@ def visualize_command(input_file, species, phase, output, format, dpi):
             click.echo(f"Generated phase space plot: {species_x} vs {species_y}")
         
         else:
-            # Time course plot
-            species_to_plot = list(species) if species else available_species
-            
+            # Time course plot. All curves go into one LineCollection:
+            # a single artist added to the axes instead of one Line2D
+            # per species, which keeps draw time flat for wide CSVs.
+            from matplotlib.collections import LineCollection
+            from matplotlib.lines import Line2D
+
+            available_set = set(available_species)
+            species_to_plot = [
+                sp for sp in (species if species else available_species)
+                if sp in available_set
+            ]
+
             fig, ax = plt.subplots(figsize=(10, 6))
-            for sp in species_to_plot:
-                if sp in available_species:
-                    ax.plot(t, df[sp].values, label=sp, linewidth=2)
-            
+
+            data = df[species_to_plot].to_numpy()
+            segments = [np.column_stack([t, data[:, i]])
+                        for i in range(data.shape[1])]
+            colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+            line_colors = [colors[i % len(colors)]
+                           for i in range(len(species_to_plot))]
+
+            ax.add_collection(LineCollection(segments, colors=line_colors,
+                                             linewidths=2))
+            ax.autoscale_view()
+
+            # LineCollection has a single legend entry, so build proxies
+            legend_handles = [
+                Line2D([], [], color=c, linewidth=2, label=sp)
+                for sp, c in zip(species_to_plot, line_colors)
+            ]
+            ax.legend(handles=legend_handles, loc='best')
+
             ax.set_xlabel('Time', fontsize=12)
             ax.set_ylabel('Concentration', fontsize=12)
             ax.set_title('Species Concentrations vs Time', fontsize=14)
-            ax.legend(loc='best')
             ax.grid(True, alpha=0.3)
             
             click.echo(f"Generated time course plot for {len(species_to_plot)} species")
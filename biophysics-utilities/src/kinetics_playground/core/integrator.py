@@ -6,7 +6,8 @@ event detection for chemical reaction networks.
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
+import scipy.linalg
+from scipy.integrate import solve_ivp, odeint
 from typing import Callable, Optional, Tuple, Dict, List, Any
 from dataclasses import dataclass, field
 import warnings
@@ -23,39 +24,55 @@ class IntegrationResult:
     njev: int = 0  # Number of Jacobian evaluations
     nlu: int = 0   # Number of LU decompositions
     species_names: List[str] = field(default_factory=list)
-    
+
+    def __post_init__(self):
+        # Per-species access (get_species, plotting, CSV export) slices
+        # rows of y; the odeint path hands back a transposed array whose
+        # rows are strided views. Normalize to C-contiguous once here so
+        # every later row slice is a contiguous block.
+        self.y = np.ascontiguousarray(self.y)
+
+    def _name_to_index(self) -> Dict[str, int]:
+        """Name -> row index map, built lazily on first lookup."""
+        idx_map = self.__dict__.get('_name_index_cache')
+        if idx_map is None:
+            idx_map = {name: i for i, name in enumerate(self.species_names)}
+            self._name_index_cache = idx_map
+        return idx_map
+
     def get_species(self, name: str) -> np.ndarray:
         """
         Get time series for a specific species.
-        
+
         Args:
             name: Species name
-            
+
         Returns:
             Array of concentrations over time
         """
-        if name not in self.species_names:
+        idx = self._name_to_index().get(name)
+        if idx is None:
             raise ValueError(f"Species '{name}' not found in results")
-        
-        idx = self.species_names.index(name)
+
         return self.y[idx, :]
-    
+
     def to_dict(self) -> Dict[str, np.ndarray]:
         """
         Convert results to dictionary format.
-        
+
         Returns:
             Dictionary with 't' and species names as keys
         """
         result_dict = {'t': self.t}
-        for name in self.species_names:
-            result_dict[name] = self.get_species(name)
+        for i, name in enumerate(self.species_names):
+            result_dict[name] = self.y[i, :]
         return result_dict
-    
+
     def final_state(self) -> Dict[str, float]:
         """Get final concentrations as dictionary."""
+        final = self.y[:, -1]
         return {
-            name: float(self.y[i, -1])
+            name: float(final[i])
             for i, name in enumerate(self.species_names)
         }
 
@@ -69,7 +86,10 @@ class ODEIntegrator:
     """
     
     AVAILABLE_METHODS = ['RK45', 'RK23', 'DOP853', 'Radau', 'BDF', 'LSODA']
-    
+
+    # Methods that accept (and benefit from) an analytic Jacobian
+    IMPLICIT_METHODS = ('Radau', 'BDF', 'LSODA')
+
     def __init__(
         self,
         dydt: Callable[[float, np.ndarray], np.ndarray],
@@ -78,19 +98,32 @@ class ODEIntegrator:
         rtol: float = 1e-6,
         atol: float = 1e-9,
         max_step: float = np.inf,
-        dense_output: bool = False
+        dense_output: bool = False,
+        jac: Optional[Callable[[float, np.ndarray], np.ndarray]] = None,
+        vectorized: bool = False
     ):
         """
         Initialize ODE integrator.
-        
+
         Args:
             dydt: Function computing derivatives with signature f(t, y) -> dy/dt
             species_names: List of species names corresponding to y components
-            method: Integration method ('RK45', 'LSODA', 'BDF', etc.)
+            method: Integration method ('RK45', 'LSODA', 'BDF', etc.),
+                or 'auto' to probe stiffness at the first integrate()
+                call and pick BDF (stiff) or DOP853 (non-stiff)
             rtol: Relative tolerance
             atol: Absolute tolerance
             max_step: Maximum allowed step size
             dense_output: Whether to compute continuous solution
+            jac: Optional analytic Jacobian jac(t, y) -> (N, N) array.
+                Passed to the implicit methods (LSODA, BDF, Radau),
+                which otherwise estimate it with N+1 extra RHS calls
+                per refresh. Ignored by the explicit methods.
+            vectorized: Declare that dydt accepts a (N, K) state matrix
+                and returns the derivatives column-wise. Radau/BDF then
+                batch their finite-difference Jacobian columns into a
+                single RHS call instead of N+1 separate ones. Functions
+                from KineticSystem.to_numerical_function support this.
         """
         self.dydt = dydt
         self.species_names = species_names
@@ -99,13 +132,30 @@ class ODEIntegrator:
         self.atol = atol
         self.max_step = max_step
         self.dense_output = dense_output
+        self.jac = jac
+        self.vectorized = vectorized
         
-        # Validate method
-        if method not in self.AVAILABLE_METHODS:
+        # Validate method ('auto' is resolved lazily at first integrate)
+        if method != 'auto' and method not in self.AVAILABLE_METHODS:
             raise ValueError(
                 f"Unknown method '{method}'. "
-                f"Available: {', '.join(self.AVAILABLE_METHODS)}"
+                f"Available: auto, {', '.join(self.AVAILABLE_METHODS)}"
             )
+
+    def _resolve_method(self, y0: np.ndarray):
+        """
+        Resolve method='auto' from a stiffness probe at y0.
+
+        Runs once: the chosen method replaces 'auto' so later calls skip
+        the probe. Stiff systems get BDF (with the analytic Jacobian if
+        one was supplied); non-stiff systems get DOP853, whose high
+        order makes the most of the tight tolerances used here.
+        """
+        if self.method != 'auto':
+            return
+        info = check_stiffness(self.dydt, np.asarray(y0, dtype=float),
+                               jac=self.jac)
+        self.method = 'BDF' if info['is_stiff'] else 'DOP853'
     
     def integrate(
         self,
@@ -113,35 +163,57 @@ class ODEIntegrator:
         t_span: Tuple[float, float],
         t_eval: Optional[np.ndarray] = None,
         events: Optional[List[Callable]] = None,
-        args: Optional[Tuple] = None
+        args: Optional[Tuple] = None,
+        validate: bool = True
     ) -> IntegrationResult:
         """
         Perform time integration.
-        
+
         Args:
             y0: Initial conditions (array of length num_species)
             t_span: Time interval (t_start, t_end)
             t_eval: Specific time points to evaluate solution
             events: Event functions for detection
             args: Additional arguments to pass to dydt
-            
+            validate: Check y0 length and sign before integrating. Tight
+                loops (sweeps, batch runs) that validated the inputs
+                once up front can pass False to skip the per-call scan.
+
         Returns:
             IntegrationResult object
         """
-        # Validate initial conditions
-        if len(y0) != len(self.species_names):
-            raise ValueError(
-                f"Initial conditions size ({len(y0)}) doesn't match "
-                f"number of species ({len(self.species_names)})"
-            )
-        
-        # Check for negative concentrations
-        if np.any(y0 < 0):
-            warnings.warn(
-                "Negative initial concentrations detected. "
-                "This may cause integration issues."
-            )
+        self._resolve_method(y0)
+
+        if validate:
+            # Validate initial conditions
+            if len(y0) != len(self.species_names):
+                raise ValueError(
+                    f"Initial conditions size ({len(y0)}) doesn't match "
+                    f"number of species ({len(self.species_names)})"
+                )
+
+            # Check for negative concentrations; min() makes one pass
+            # instead of materializing a boolean mask for np.any
+            if np.min(y0) < 0:
+                warnings.warn(
+                    "Negative initial concentrations detected. "
+                    "This may cause integration issues."
+                )
         
+        # LSODA runs without events or dense output go straight through
+        # odeint, which drives the same Fortran solver but skips
+        # solve_ivp's per-step Python bookkeeping
+        if (
+            self.method == 'LSODA'
+            and t_eval is not None
+            and events is None
+            and not self.dense_output
+            and len(t_eval) > 1
+            and t_eval[0] == t_span[0]
+            and t_eval[-1] == t_span[1]
+        ):
+            return self._integrate_lsoda_direct(y0, t_eval, args)
+
         # Perform integration
         sol = solve_ivp(
             self.dydt,
@@ -154,7 +226,9 @@ class ODEIntegrator:
             rtol=self.rtol,
             atol=self.atol,
             max_step=self.max_step,
-            args=args or ()
+            args=args or (),
+            jac=self.jac if self.method in self.IMPLICIT_METHODS else None,
+            vectorized=self.vectorized
         )
         
         # Package results
@@ -170,7 +244,114 @@ class ODEIntegrator:
         )
         
         return result
-    
+
+    def _integrate_lsoda_direct(
+        self,
+        y0: np.ndarray,
+        t_eval: np.ndarray,
+        args: Optional[Tuple]
+    ) -> IntegrationResult:
+        """
+        Integrate with odeint's direct LSODA binding.
+
+        Same underlying Fortran solver as method='LSODA' in solve_ivp,
+        minus the OdeSolver step loop and per-step Python overhead, which
+        is significant for small systems. Only used for plain fixed-grid
+        integrations (no events, no dense output).
+        """
+        y, info = odeint(
+            self.dydt,
+            y0,
+            t_eval,
+            args=args or (),
+            Dfun=self.jac,
+            rtol=self.rtol,
+            atol=self.atol,
+            hmax=0.0 if np.isinf(self.max_step) else self.max_step,
+            tfirst=True,
+            full_output=True
+        )
+
+        message = info['message']
+        return IntegrationResult(
+            # Own copy: t_eval may be a shared read-only grid (the
+            # lru-cached one in reaction_network), and results must
+            # stay independently mutable
+            t=np.array(t_eval),
+            y=y.T,
+            success=message == 'Integration successful.',
+            message=message,
+            nfev=int(info['nfe'][-1]),
+            species_names=self.species_names.copy()
+        )
+
+    def integrate_batch(
+        self,
+        Y0: np.ndarray,
+        t_span: Tuple[float, float],
+        t_eval: Optional[np.ndarray] = None
+    ) -> List[IntegrationResult]:
+        """
+        Integrate K initial conditions in one solver call.
+
+        The K independent copies are stacked into a single state vector
+        of length K*N, so the solver's step-control and Python overhead
+        is paid once for the whole batch instead of once per run. The
+        step size adapts to the hardest copy, so this pays off when the
+        runs have comparable dynamics (e.g. an initial-condition scan).
+        Best used with explicit methods: an implicit method would
+        finite-difference a (K*N)^2 Jacobian even though the true one is
+        block-diagonal. Mass-action networks get a fully vectorized
+        version of this via ReactionNetwork.parameter_sweep(batched=True).
+
+        Args:
+            Y0: Initial conditions, shape (K, num_species)
+            t_span: Time interval (t_start, t_end)
+            t_eval: Specific time points to evaluate solution
+
+        Returns:
+            List of K IntegrationResult objects, in input order
+        """
+        Y0 = np.asarray(Y0, dtype=float)
+        n = len(self.species_names)
+        if Y0.ndim != 2 or Y0.shape[1] != n:
+            raise ValueError(
+                f"Y0 must have shape (K, {n}), got {Y0.shape}"
+            )
+        K = Y0.shape[0]
+        self._resolve_method(Y0[0])
+        dydt = self.dydt
+
+        def batched_rhs(t, z):
+            Z = z.reshape(K, n)
+            out = np.empty_like(Z)
+            for i in range(K):
+                out[i] = dydt(t, Z[i])
+            return out.ravel()
+
+        sol = solve_ivp(
+            batched_rhs,
+            t_span,
+            Y0.ravel(),
+            method=self.method,
+            t_eval=t_eval,
+            rtol=self.rtol,
+            atol=self.atol,
+            max_step=self.max_step
+        )
+
+        return [
+            IntegrationResult(
+                t=sol.t,
+                y=sol.y[i * n:(i + 1) * n, :],
+                success=sol.success,
+                message=sol.message,
+                nfev=sol.nfev,
+                species_names=self.species_names.copy()
+            )
+            for i in range(K)
+        ]
+
     def integrate_to_steady_state(
         self,
         y0: np.ndarray,
@@ -190,11 +371,16 @@ class ODEIntegrator:
         Returns:
             IntegrationResult at steady state
         """
-        # Define event to detect steady state
+        # Define event to detect steady state. The event fires at every
+        # accepted step, so the |dy/dt| scratch array is allocated once
+        # here and reused rather than per call.
+        _abs = np.empty(len(y0))
+
         def steady_state_event(t, y):
             """Event function: returns 0 when steady state reached."""
             dydt_val = self.dydt(t, y)
-            return np.max(np.abs(dydt_val)) - steady_state_tol
+            np.abs(dydt_val, out=_abs)
+            return _abs.max() - steady_state_tol
         
         steady_state_event.terminal = True
         steady_state_event.direction = -1
@@ -217,30 +403,55 @@ class ODEIntegrator:
         y0: np.ndarray,
         t_span: Tuple[float, float],
         parameter_indices: List[int],
-        perturbation: float = 0.01
+        perturbation: float = 0.01,
+        n_workers: Optional[int] = None
     ) -> Dict[int, IntegrationResult]:
         """
         Perform simple sensitivity analysis by perturbing parameters.
-        
+
         Args:
             y0: Initial conditions
             t_span: Time interval
             parameter_indices: Which parameters (species) to perturb
             perturbation: Fractional perturbation amount
-            
+            n_workers: Number of worker processes. The perturbed runs
+                are independent, so with n_workers > 1 they are
+                dispatched across a process pool. The RHS must be
+                picklable for this; lambdified closures often are not,
+                in which case the analysis falls back to serial with a
+                warning.
+
         Returns:
             Dictionary mapping parameter index to perturbed result
         """
-        results = {}
-        
+        perturbed = []
         for idx in parameter_indices:
             y0_perturbed = y0.copy()
             y0_perturbed[idx] *= (1.0 + perturbation)
-            
-            result = self.integrate(y0_perturbed, t_span)
-            results[idx] = result
-        
-        return results
+            perturbed.append(y0_perturbed)
+
+        if n_workers is not None and n_workers > 1 and len(perturbed) > 1:
+            import pickle
+            from concurrent.futures import ProcessPoolExecutor
+
+            try:
+                with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                    futures = [
+                        executor.submit(self.integrate, y0p, t_span)
+                        for y0p in perturbed
+                    ]
+                    outputs = [f.result() for f in futures]
+                return dict(zip(parameter_indices, outputs))
+            except (pickle.PicklingError, AttributeError, TypeError):
+                warnings.warn(
+                    "RHS function is not picklable; running sensitivity "
+                    "analysis serially instead"
+                )
+
+        return {
+            idx: self.integrate(y0p, t_span)
+            for idx, y0p in zip(parameter_indices, perturbed)
+        }
 
 
 def create_time_points(t_start: float, t_end: float, num_points: int = 1000,
@@ -263,48 +474,81 @@ def create_time_points(t_start: float, t_end: float, num_points: int = 1000,
         return np.linspace(t_start, t_end, num_points)
 
 
-def check_stiffness(dydt: Callable, y0: np.ndarray, t: float = 0.0) -> Dict[str, Any]:
+def check_stiffness(dydt: Callable, y0: np.ndarray, t: float = 0.0,
+                    jac: Optional[Callable] = None) -> Dict[str, Any]:
     """
     Heuristic check for stiffness of ODE system.
-    
+
     Estimates the Jacobian and computes its eigenvalues to assess stiffness.
-    
+
     Args:
         dydt: ODE function
         y0: State vector
         t: Time point
-        
+        jac: Optional analytic Jacobian jac(t, y); when supplied, used
+            directly instead of the finite-difference estimate
+
     Returns:
         Dictionary with stiffness metrics
     """
     n = len(y0)
     eps = 1e-8
-    
-    # Estimate Jacobian by finite differences
-    J = np.zeros((n, n))
-    f0 = dydt(t, y0)
-    
-    for i in range(n):
-        y_pert = y0.copy()
-        y_pert[i] += eps
-        f_pert = dydt(t, y_pert)
-        J[:, i] = (f_pert - f0) / eps
-    
-    # Compute eigenvalues
-    eigenvalues = np.linalg.eigvals(J)
-    
+
+    if jac is not None:
+        J = np.asarray(jac(t, y0), dtype=float)
+    else:
+        # Estimate Jacobian by finite differences: evaluate the RHS at
+        # all n perturbed states, stack into a (n, n) matrix, and form
+        # the whole difference quotient in one broadcasted operation
+        f0 = np.asarray(dydt(t, y0), dtype=float)
+        Y_pert = np.tile(np.asarray(y0, dtype=float), (n, 1))
+        Y_pert[np.diag_indices(n)] += eps
+        F = np.column_stack([dydt(t, Y_pert[i]) for i in range(n)])
+        J = (F - f0[:, None]) / eps
+
+    # The stiffness ratio only needs the extreme eigenvalues. For large
+    # systems ask ARPACK for just those two instead of the full O(n^3)
+    # dense spectrum; conservation laws make J singular, in which case
+    # the smallest-magnitude estimate is the useless zero mode and we
+    # fall back to the full solve to find the smallest nonzero one.
+    eigenvalues = None
+    max_abs = None
+    min_abs = None
+
+    if n >= 50:
+        try:
+            from scipy.sparse.linalg import eigs
+            lam_max = eigs(J, k=1, which='LM', return_eigenvectors=False)[0]
+            lam_min = eigs(J, k=1, which='SM', return_eigenvectors=False)[0]
+            max_abs = float(np.abs(lam_max))
+            min_abs = float(np.abs(lam_min))
+            if min_abs <= 1e-10:
+                max_abs = None
+                min_abs = None
+        except Exception:
+            # ARPACK convergence is not guaranteed; dense path below
+            max_abs = None
+            min_abs = None
+
+    if max_abs is None:
+        eigenvalues = scipy.linalg.eigvals(J)
+        abs_eigs = np.abs(eigenvalues)
+        max_abs = float(np.max(abs_eigs))
+        nonzero = abs_eigs[abs_eigs > 1e-10]
+        min_abs = float(np.min(nonzero)) if nonzero.size else 0.0
+
     # Stiffness ratio: |max eigenvalue| / |min eigenvalue|
-    abs_eigs = np.abs(eigenvalues)
-    stiffness_ratio = np.max(abs_eigs) / np.min(abs_eigs[abs_eigs > 1e-10])
-    
+    stiffness_ratio = max_abs / min_abs if min_abs > 0 else np.inf
+
     # System is considered stiff if ratio > 1000
     is_stiff = stiffness_ratio > 1000
-    
+
     return {
         'is_stiff': is_stiff,
         'stiffness_ratio': stiffness_ratio,
-        'max_eigenvalue': np.max(abs_eigs),
-        'min_eigenvalue': np.min(abs_eigs[abs_eigs > 1e-10]) if np.any(abs_eigs > 1e-10) else 0,
+        'max_eigenvalue': max_abs,
+        'min_eigenvalue': min_abs,
+        # None when the iterative path was taken (full spectrum not computed)
         'eigenvalues': eigenvalues,
         'recommended_method': 'BDF' if is_stiff else 'RK45'
     }
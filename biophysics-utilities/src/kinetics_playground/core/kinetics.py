@@ -5,6 +5,8 @@ Implements mass-action kinetics by default with support for custom kinetic laws
 like Michaelis-Menten, Hill equations, etc.
 """
 
+import re
+
 import sympy as sp
 from typing import Dict, List, Callable, Optional, Tuple
 import numpy as np
@@ -172,27 +174,67 @@ class CustomKineticLaw(KineticLaw):
         """
         self.formula = formula
         self.parameters = parameters or {}
-    
-    def get_rate_expression(self, reaction: Reaction, species_symbols: Dict[str, sp.Symbol]) -> sp.Expr:
-        """Parse and return custom rate expression."""
-        # Replace species names with symbols
-        expr_str = self.formula
-        for species_name, symbol in species_symbols.items():
-            expr_str = expr_str.replace(f"[{species_name}]", str(symbol))
-        
-        # Replace parameters
-        for param_name, param_value in self.parameters.items():
-            expr_str = expr_str.replace(param_name, str(param_value))
-        
-        # Parse with SymPy
+
+        # Parse once at construction: strip the [A] bracket notation,
+        # sympify, and bake in the parameter values. sympify is by far
+        # the expensive step, and the old per-call string replacement
+        # repeated it for every reaction on every system rebuild.
+        expr_str = re.sub(r'\[(\w+)\]', r'\1', formula)
         expr = sp.sympify(expr_str)
-        return expr
+        expr = expr.subs({
+            sp.Symbol(name): sp.Float(value)
+            for name, value in self.parameters.items()
+        })
+        self._parsed_expr = expr
+
+    def get_rate_expression(self, reaction: Reaction, species_symbols: Dict[str, sp.Symbol]) -> sp.Expr:
+        """Return the pre-parsed rate expression in the system's symbols."""
+        subs = {
+            sym: species_symbols[sym.name]
+            for sym in self._parsed_expr.free_symbols
+            if sym.name in species_symbols
+        }
+        return self._parsed_expr.subs(subs, simultaneous=True)
     
     def get_parameters(self) -> Dict[str, float]:
         """Get custom parameters."""
         return self.parameters.copy()
 
 
+# Numba-compiled RHS kernels, cached by network structure and rate
+# constants so repeated sweeps/benchmarks reuse a single compilation
+_COMPILED_RHS_CACHE = {}
+
+
+def _try_njit(func):
+    """
+    Opportunistically wrap a lambdified function with numba.njit.
+
+    Numba compiles lazily at the first call; if the generated code is
+    not nopython-compilable (or numba is not installed), the wrapper
+    falls back to the plain lambdified function permanently. Errors
+    raised by the fallback itself still propagate.
+    """
+    try:
+        import numba
+    except ImportError:
+        return func
+
+    compiled = numba.njit(cache=True, fastmath=True)(func)
+    state = {'fn': compiled}
+
+    def dispatch(*args):
+        try:
+            return state['fn'](*args)
+        except Exception:
+            if state['fn'] is func:
+                raise
+            state['fn'] = func
+            return func(*args)
+
+    return dispatch
+
+
 class KineticSystem:
     """
     Generates symbolic ODE system from reaction network and kinetic laws.
@@ -222,99 +264,346 @@ class KineticSystem:
         # Default: use mass action for all reactions
         for reaction in model.reactions:
             self.kinetic_laws[reaction.index] = MassActionKinetics(reaction.rate_constant)
-    
+
+        # Symbolic construction caches; every to_*_function call starts
+        # from get_ode_system, so without these the rate expressions and
+        # the S·v assembly are redone per call. Invalidated whenever a
+        # kinetic law changes.
+        self._rate_expr_cache: Optional[List[sp.Expr]] = None
+        self._ode_system_cache: Optional[Dict[sp.Symbol, sp.Expr]] = None
+
+        # Shared StoichiometricMatrix; the network structure is fixed
+        # for the lifetime of a KineticSystem (ReactionNetwork rebuilds
+        # the whole system on structural changes), so one instance can
+        # serve the symbolic assembly and every RHS builder
+        self._stoich_matrix = None
+
+    def _get_stoich(self):
+        """Lazily build and cache the StoichiometricMatrix."""
+        if self._stoich_matrix is None:
+            from kinetics_playground.core.stoichiometry import StoichiometricMatrix
+            self._stoich_matrix = StoichiometricMatrix(self.model)
+        return self._stoich_matrix
+
     def set_kinetic_law(self, reaction_index: int, kinetic_law: KineticLaw):
         """
         Set custom kinetic law for a specific reaction.
-        
+
         Args:
             reaction_index: Index of the reaction
             kinetic_law: KineticLaw instance to use
         """
         self.kinetic_laws[reaction_index] = kinetic_law
-    
+        self._rate_expr_cache = None
+        self._ode_system_cache = None
+
     def get_rate_expressions(self) -> List[sp.Expr]:
         """
         Get symbolic rate expressions for all reactions.
-        
+
+        Cached until a kinetic law changes; sympy expressions are
+        immutable, so sharing the cached list entries is safe.
+
         Returns:
             List of SymPy expressions, one for each reaction
         """
+        if self._rate_expr_cache is not None:
+            return list(self._rate_expr_cache)
+
         rate_exprs = []
         for reaction in self.model.reactions:
             kinetic_law = self.kinetic_laws[reaction.index]
             rate_expr = kinetic_law.get_rate_expression(reaction, self.species_symbols)
             rate_exprs.append(rate_expr)
-        
-        return rate_exprs
-    
+
+        self._rate_expr_cache = rate_exprs
+        return list(rate_exprs)
+
     def get_ode_system(self) -> Dict[sp.Symbol, sp.Expr]:
         """
         Generate symbolic ODE system.
-        
+
+        The assembled system is cached until set_kinetic_law is called,
+        so the RHS/Jacobian/compiled builders all share one symbolic
+        construction pass.
+
         Returns:
             Dictionary mapping species symbols to their time derivatives
         """
-        from kinetics_playground.core.stoichiometry import StoichiometricMatrix
-        
+        if self._ode_system_cache is not None:
+            return dict(self._ode_system_cache)
+
         # Get stoichiometric matrix
-        stoich_matrix = StoichiometricMatrix(self.model)
-        S = stoich_matrix.get_matrix()
-        
+        S = self._get_stoich().get_matrix()
+
         # Get rate expressions
         rate_exprs = self.get_rate_expressions()
         
-        # Compute d[S]/dt = S · v
+        # Compute d[S]/dt = S · v by visiting only the nonzero entries
+        # of S (reaction networks are sparse: most species take part in
+        # few reactions). Terms are collected per species and summed
+        # with a single sp.Add instead of repeated __iadd__, and unit
+        # coefficients skip the symbolic multiplication entirely.
+        terms: List[List[sp.Expr]] = [[] for _ in self.model.species]
+        rows, cols = np.nonzero(S)
+        for i, j in zip(rows, cols):
+            coeff = S[i, j]
+            rate_expr = rate_exprs[j]
+            if coeff == 1:
+                terms[i].append(rate_expr)
+            elif coeff == -1:
+                terms[i].append(-rate_expr)
+            else:
+                terms[i].append(sp.nsimplify(coeff) * rate_expr)
+
         ode_system = {}
         for i, species in enumerate(self.model.species):
             symbol = self.species_symbols[species.name]
-            
-            # Sum over all reactions
-            rhs = sp.Integer(0)
-            for j, rate_expr in enumerate(rate_exprs):
-                stoich_coeff = S[i, j]
-                if stoich_coeff != 0:
-                    rhs += stoich_coeff * rate_expr
-            
-            ode_system[symbol] = rhs
-        
-        return ode_system
+            ode_system[symbol] = sp.Add(*terms[i]) if terms[i] else sp.Integer(0)
+
+        self._ode_system_cache = ode_system
+        return dict(ode_system)
     
-    def to_numerical_function(self) -> Callable:
+    def to_numerical_function(self, use_numba: bool = False) -> Callable:
         """
         Convert symbolic ODE system to numerical Python function.
-        
+
+        The whole system is lambdified as one vector function with
+        common subexpressions factored out (cse), so every RHS
+        evaluation is a single generated-code call instead of one
+        Python-level call per species - the per-call dispatch is what
+        dominates solve_ivp runtime for small systems.
+
+        Args:
+            use_numba: Attempt to njit-compile the lambdified function,
+                removing the remaining interpreter dispatch per step.
+                Best effort: falls back to the plain function if numba
+                is missing or cannot compile the generated code (pure
+                mass-action systems get a guaranteed compiled kernel
+                through to_compiled_function instead).
+
         Returns:
             Function with signature f(t, y) -> dy/dt suitable for scipy.integrate
         """
         ode_system = self.get_ode_system()
-        
+
         # Get ordered list of species symbols
         symbols = [self.species_symbols[s.name] for s in self.model.species]
-        
+
         # Get ordered list of ODEs
         odes = [ode_system[sym] for sym in symbols]
-        
-        # Lambdify for fast numerical evaluation
-        # Note: lambdify takes (symbols, expression)
-        # We create a function that takes t and y array
-        funcs = [sp.lambdify(symbols, ode, modules='numpy') for ode in odes]
-        
+
+        # Lambdify the full system at once; the generated function
+        # returns all derivatives from a single call
+        f = sp.lambdify(symbols, odes, modules='numpy', cse=True)
+        if use_numba:
+            f = _try_njit(f)
+
         def dydt(t, y):
             """
             Compute time derivatives.
-            
+
+            Supports both a 1-D state vector and an (N, K) matrix of K
+            stacked states - the lambdified function broadcasts over
+            the extra axis, which lets solve_ivp(vectorized=True) batch
+            its finite-difference Jacobian columns into one call.
+
             Args:
                 t: Time (not used in autonomous systems)
-                y: Array of species concentrations
-                
+                y: Array of species concentrations, shape (N,) or (N, K)
+
             Returns:
-                Array of time derivatives
+                Array of time derivatives matching the input shape
             """
-            return np.array([func(*y) for func in funcs])
-        
+            y = np.asarray(y)
+            vals = f(*y)
+            if y.ndim == 2:
+                # Row-wise assignment so constant ODEs (scalar results
+                # from the broadcast) expand to full rows
+                out = np.empty((len(vals), y.shape[1]), dtype=float)
+                for i, v in enumerate(vals):
+                    out[i] = v
+                return out
+            return np.asarray(vals, dtype=float)
+
         return dydt
     
+    def to_jacobian_function(self, use_numba: bool = False) -> Callable:
+        """
+        Build the analytic Jacobian d(dy/dt)/dy as a numerical function.
+
+        Differentiates the symbolic ODE system once and lambdifies the
+        resulting matrix (with cse). Implicit solvers (LSODA, BDF,
+        Radau) otherwise approximate the Jacobian by finite differences
+        at N+1 RHS evaluations per refresh, which dominates runtime for
+        stiff networks.
+
+        Args:
+            use_numba: Attempt to njit-compile the lambdified matrix
+                function (same best-effort semantics as
+                to_numerical_function)
+
+        Returns:
+            Function with signature jac(t, y) -> (N, N) array
+        """
+        ode_system = self.get_ode_system()
+        symbols = [self.species_symbols[s.name] for s in self.model.species]
+        odes = [ode_system[sym] for sym in symbols]
+
+        jac_exprs = sp.Matrix(odes).jacobian(symbols)
+        jf = sp.lambdify(symbols, jac_exprs, modules='numpy', cse=True)
+        if use_numba:
+            jf = _try_njit(jf)
+
+        def jac(t, y):
+            """Evaluate the Jacobian at (t, y)."""
+            return np.asarray(jf(*y), dtype=float)
+
+        return jac
+
+    def _mass_action_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pack the mass-action system into dense arrays.
+
+        Returns:
+            Tuple (S, E, k): stoichiometric matrix (num_species x num_reactions),
+            reactant exponent matrix (num_reactions x num_species), and
+            rate constant vector (num_reactions)
+        """
+        S = self._get_stoich().get_matrix()
+        num_reactions = self.model.num_reactions()
+        num_species = self.model.num_species()
+
+        E = np.zeros((num_reactions, num_species))
+        k = np.zeros(num_reactions)
+
+        for reaction in self.model.reactions:
+            law = self.kinetic_laws[reaction.index]
+            if law.rate_constant is not None:
+                k[reaction.index] = law.rate_constant
+            elif reaction.rate_constant is not None:
+                k[reaction.index] = reaction.rate_constant
+            else:
+                k[reaction.index] = 1.0
+
+            for species_name, stoich_coeff in reaction.reactants.items():
+                idx = self.model.get_species_index(species_name)
+                E[reaction.index, idx] = stoich_coeff
+
+        return S, E, k
+
+    def to_vectorized_function(
+        self, rate_array: Optional[np.ndarray] = None
+    ) -> Optional[Tuple[Callable, np.ndarray]]:
+        """
+        Build a dense NumPy mass-action RHS without symbolic codegen.
+
+        The whole right-hand side collapses to three array ops: one
+        broadcasted power against the reactant-exponent matrix, one
+        product reduction to the per-reaction rate vector, and one
+        matvec with the stoichiometric matrix (dydt = S @ (k * prod(y**E))).
+        No per-reaction Python loop and no lambdified sub-functions.
+
+        Args:
+            rate_array: Optional (num_reactions,) array to read rate
+                constants from by reference; mutating it updates the RHS
+                in place. Defaults to the model's current constants.
+
+        Returns:
+            (dydt, rate_array) tuple, or None when any reaction uses a
+            non-mass-action kinetic law
+        """
+        if not all(isinstance(law, MassActionKinetics)
+                   for law in self.kinetic_laws.values()):
+            return None
+
+        S, E, k = self._mass_action_arrays()
+        if rate_array is None:
+            rate_array = k
+
+        # Biochemical networks are typically sparse (most species do not
+        # appear in most reactions): switch the matvec to CSR when that
+        # pays, so S @ v walks only the nonzeros. Small or dense
+        # matrices stay dense, where BLAS wins over the sparse overhead.
+        nnz = np.count_nonzero(S)
+        if S.size >= 256 and nnz < 0.3 * S.size:
+            S = self._get_stoich().get_sparse()
+
+        def dydt(t, y):
+            v = rate_array * np.prod(y ** E, axis=1)
+            return S @ v
+
+        return dydt, rate_array
+
+    def to_numerical_function_fast(self) -> Callable:
+        """
+        Best plain-NumPy RHS for this system.
+
+        Pure mass-action systems get the vectorized array-expression
+        RHS from to_vectorized_function (no symbolic codegen at all);
+        anything else falls back to the lambdified function. Use
+        to_compiled_function when Numba may be available.
+
+        Returns:
+            Function with signature f(t, y) -> dy/dt suitable for scipy.integrate
+        """
+        vectorized = self.to_vectorized_function()
+        if vectorized is not None:
+            return vectorized[0]
+        return self.to_numerical_function()
+
+    def to_compiled_function(self) -> Callable:
+        """
+        Build a Numba-compiled RHS for pure mass-action systems.
+
+        Eliminates Python interpreter overhead per solve_ivp function
+        evaluation. Falls back to to_numerical_function() when Numba is
+        not installed (it is an optional 'performance' dependency) or
+        when any reaction uses a non-mass-action kinetic law. Compiled
+        kernels are cached by stoichiometry and rate constants, so
+        parameter sweeps and benchmark loops reuse one compilation.
+
+        Returns:
+            Function with signature f(t, y) -> dy/dt suitable for scipy.integrate
+        """
+        if not all(isinstance(law, MassActionKinetics)
+                   for law in self.kinetic_laws.values()):
+            return self.to_numerical_function()
+
+        try:
+            import numba
+        except ImportError:
+            # Pure mass-action but no Numba: the vectorized dense RHS
+            # still beats the per-species lambdified loop
+            vectorized, _ = self.to_vectorized_function()
+            return vectorized
+
+        S, E, k = self._mass_action_arrays()
+        key = (S.shape, S.tobytes(), E.tobytes(), k.tobytes())
+
+        if key in _COMPILED_RHS_CACHE:
+            return _COMPILED_RHS_CACHE[key]
+
+        num_reactions, num_species = E.shape
+
+        def rhs(t, y):
+            dydt = np.zeros(num_species)
+            for j in range(num_reactions):
+                v = k[j]
+                for i in range(num_species):
+                    e = E[j, i]
+                    if e != 0.0:
+                        v *= y[i] ** e
+                for i in range(num_species):
+                    s = S[i, j]
+                    if s != 0.0:
+                        dydt[i] += s * v
+            return dydt
+
+        compiled = numba.njit(fastmath=True)(rhs)
+        _COMPILED_RHS_CACHE[key] = compiled
+        return compiled
+
     def to_latex(self) -> List[str]:
         """
         Generate LaTeX representation of the ODE system.
@@ -9,23 +9,23 @@ from dataclasses import dataclass, field
 import numpy as np
 
 
-@dataclass
+@dataclass(eq=False)
 class Species:
-    """Represents a chemical species in the reaction network."""
+    """
+    Represents a chemical species in the reaction network.
+
+    Equality and hashing are identity-based: ReactionModel guarantees
+    one Species instance per name, so within a model identity and
+    name-equality coincide, and set/dict operations use CPython's
+    default C-level hash instead of a Python-level __hash__ call per
+    probe.
+    """
     name: str
     index: int
     initial_concentration: float = 0.0
     is_constant: bool = False  # For boundary species
     units: str = "M"  # Molar concentration by default
-    
-    def __hash__(self):
-        return hash(self.name)
-    
-    def __eq__(self, other):
-        if isinstance(other, Species):
-            return self.name == other.name
-        return False
-    
+
     def __repr__(self):
         return f"Species(name='{self.name}', index={self.index})"
 
@@ -40,43 +40,98 @@ class Reaction:
     reversible: bool = False
     kinetic_law: str = "mass_action"
     parameters: Dict[str, float] = field(default_factory=dict)
-    name: Optional[str] = None
-    
+    _name: Optional[str] = field(default=None, repr=False)
+
     def __post_init__(self):
-        if self.name is None:
-            # Auto-generate name
+        # Memoized topology queries; reactants/products are treated as
+        # immutable once the reaction is constructed
+        self._all_species = None
+        self._net_stoich = None
+
+    @property
+    def name(self) -> str:
+        """
+        Display name ("R0: A + B -> C"), generated lazily.
+
+        Numeric workloads never read it; deferring the string formatting
+        keeps model construction free of per-reaction join/format work.
+        """
+        if self._name is None:
             reactant_str = " + ".join(
-                f"{v:.0f}{k}" if v != 1 else k 
+                f"{v:.0f}{k}" if v != 1 else k
                 for k, v in self.reactants.items()
             )
             product_str = " + ".join(
-                f"{v:.0f}{k}" if v != 1 else k 
+                f"{v:.0f}{k}" if v != 1 else k
                 for k, v in self.products.items()
             )
             arrow = "<->" if self.reversible else "->"
-            self.name = f"R{self.index}: {reactant_str} {arrow} {product_str}"
-    
+            self._name = f"R{self.index}: {reactant_str} {arrow} {product_str}"
+        return self._name
+
+    @name.setter
+    def name(self, value: Optional[str]):
+        self._name = value
+
     def get_all_species(self) -> Set[str]:
-        """Get all species involved in this reaction."""
-        return set(self.reactants.keys()) | set(self.products.keys())
-    
+        """
+        Get all species involved in this reaction.
+
+        Memoized; the returned set is shared, do not mutate it.
+        """
+        if self._all_species is None:
+            self._all_species = set(self.reactants.keys()) | set(self.products.keys())
+        return self._all_species
+
     def net_stoichiometry(self) -> Dict[str, float]:
         """
         Calculate net stoichiometry for each species.
-        
+
+        Memoized; the returned dict is shared, do not mutate it.
+
         Returns:
             Dictionary mapping species to net change (products - reactants)
         """
+        if self._net_stoich is not None:
+            return self._net_stoich
+
         net = {}
-        
+
         # Subtract reactants
         for species, coeff in self.reactants.items():
             net[species] = net.get(species, 0.0) - coeff
-        
+
         # Add products
         for species, coeff in self.products.items():
             net[species] = net.get(species, 0.0) + coeff
-        
+
+        self._net_stoich = net
+        return net
+
+    def net_stoichiometry_vec(self, num_species: int) -> np.ndarray:
+        """
+        Net stoichiometry as a dense vector in species-index space.
+
+        The array counterpart of net_stoichiometry() for numeric
+        callers: C-level np.add.at accumulation over the finalized
+        index/coefficient arrays, which also nets out catalysts that
+        appear on both sides. Requires ReactionModel.finalize() to have
+        run on the owning model.
+
+        Args:
+            num_species: Length of the output vector (model species count)
+
+        Returns:
+            Array of net coefficients (products - reactants)
+        """
+        if not hasattr(self, '_react_idx'):
+            raise RuntimeError(
+                "net_stoichiometry_vec requires the owning "
+                "ReactionModel to be finalized"
+            )
+        net = np.zeros(num_species, dtype=self._react_coef.dtype)
+        np.add.at(net, self._react_idx, -self._react_coef)
+        np.add.at(net, self._prod_idx, self._prod_coef)
         return net
     
     def __repr__(self):
@@ -91,11 +146,37 @@ class ReactionModel:
     querying network topology and constructing computational models.
     """
     
-    def __init__(self):
+    def __init__(self, dtype=np.float64):
+        """
+        Initialize an empty reaction model.
+
+        Args:
+            dtype: Floating dtype for the numeric arrays derived from
+                this model (initial concentrations, stoichiometric
+                coefficients, rate constants). float64 by default;
+                float32 halves the memory traffic of the matvec-bound
+                RHS paths at the cost of ~7 significant digits, which
+                is usually fine for non-stiff networks.
+        """
+        self.dtype = np.dtype(dtype)
         self.species: List[Species] = []
         self.reactions: List[Reaction] = []
         self._species_map: Dict[str, Species] = {}  # name -> Species
         self._species_index_map: Dict[str, int] = {}  # name -> index
+
+        # Contiguous initial-concentration storage, grown alongside
+        # add_species with amortized doubling. The per-Species dataclass
+        # field stays in sync (set_initial_concentration writes both) so
+        # summaries and exporters keep reading the field, while solvers
+        # get their y0 without re-boxing one Python float per species.
+        self._ic = np.zeros(8, dtype=self.dtype)
+
+        # Set by finalize() once the topology is frozen into arrays
+        self._finalized = False
+
+        # Lazy (sorted_names, index) arrays for vectorized bulk name
+        # resolution; see set_initial_concentrations
+        self._name_arrays = None
     
     def add_species(self, name: str, initial_concentration: float = 0.0, 
                    is_constant: bool = False) -> Species:
@@ -124,7 +205,13 @@ class ReactionModel:
         self.species.append(species)
         self._species_map[name] = species
         self._species_index_map[name] = index
-        
+
+        if index >= self._ic.shape[0]:
+            self._ic = np.resize(self._ic, self._ic.shape[0] * 2)
+        self._ic[index] = initial_concentration
+
+        self._finalized = False
+        self._name_arrays = None
         return species
     
     def add_reaction(self, reactants: Dict[str, float], products: Dict[str, float],
@@ -162,8 +249,161 @@ class ReactionModel:
         )
         
         self.reactions.append(reaction)
+        self._finalized = False
         return reaction
-    
+
+    def finalize(self):
+        """
+        Freeze each reaction's stoichiometry into typed arrays.
+
+        Populates parallel int32 index / float64 coefficient arrays
+        (reaction._react_idx, ._react_coef, ._prod_idx, ._prod_coef)
+        resolved against the species index map, so numeric consumers
+        (matrix assembly, rate kernels) read contiguous arrays instead
+        of hashing species names per entry. The name-keyed dicts remain
+        the canonical, user-facing representation.
+
+        Idempotent: re-runs only after add_species/add_reaction have
+        changed the topology.
+        """
+        if self._finalized:
+            return
+
+        index_map = self._species_index_map
+        for reaction in self.reactions:
+            reaction._react_idx = np.fromiter(
+                (index_map[s] for s in reaction.reactants),
+                dtype=np.int32, count=len(reaction.reactants)
+            )
+            reaction._react_coef = np.fromiter(
+                reaction.reactants.values(),
+                dtype=self.dtype, count=len(reaction.reactants)
+            )
+            reaction._prod_idx = np.fromiter(
+                (index_map[s] for s in reaction.products),
+                dtype=np.int32, count=len(reaction.products)
+            )
+            reaction._prod_coef = np.fromiter(
+                reaction.products.values(),
+                dtype=self.dtype, count=len(reaction.products)
+            )
+
+        # Model-level CSR-style concatenation: segment j of each triple
+        # (offsets[j]:offsets[j+1]) holds reaction j's entries. This is
+        # the layout the compiled RHS kernel and bulk rate evaluation
+        # walk without any per-reaction Python iteration.
+        reactions = self.reactions
+        self._react_offsets = np.concatenate((
+            [0], np.cumsum([len(r.reactants) for r in reactions], dtype=np.int64)
+        ))
+        self._prod_offsets = np.concatenate((
+            [0], np.cumsum([len(r.products) for r in reactions], dtype=np.int64)
+        ))
+        if reactions:
+            self._react_species = np.concatenate([r._react_idx for r in reactions])
+            self._react_coefs = np.concatenate([r._react_coef for r in reactions])
+            self._prod_species = np.concatenate([r._prod_idx for r in reactions])
+            self._prod_coefs = np.concatenate([r._prod_coef for r in reactions])
+        else:
+            self._react_species = np.empty(0, dtype=np.int32)
+            self._react_coefs = np.empty(0, dtype=self.dtype)
+            self._prod_species = np.empty(0, dtype=np.int32)
+            self._prod_coefs = np.empty(0, dtype=self.dtype)
+
+        self._finalized = True
+
+    def compute_rates(self, c: np.ndarray, k: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Evaluate all mass-action rates v_j = k_j * prod(c_i^nu_ij) at once.
+
+        Two C-level array operations over the finalized CSR-style
+        layout: one gather-and-power over the concatenated reactant
+        entries, then a segment product via np.multiply.reduceat at the
+        reaction offsets. No per-reaction Python loop.
+
+        Args:
+            c: Concentration vector (num_species,)
+            k: Optional rate-constant vector; defaults to the reactions'
+                current constants (missing constants default to 1.0,
+                matching the kinetics module)
+
+        Returns:
+            Rate vector (num_reactions,)
+        """
+        self.finalize()
+
+        if k is None:
+            k = np.array([
+                r.rate_constant if r.rate_constant is not None else 1.0
+                for r in self.reactions
+            ], dtype=self.dtype)
+
+        n_reactions = len(self.reactions)
+        if n_reactions == 0:
+            return np.empty(0, dtype=self.dtype)
+
+        powed = np.power(
+            np.asarray(c)[self._react_species], self._react_coefs
+        )
+        lengths = np.diff(self._react_offsets)
+
+        if lengths.min() > 0:
+            v = np.multiply.reduceat(powed, self._react_offsets[:-1])
+        else:
+            # Source reactions (no reactants) have an empty segment,
+            # where reduceat would return a neighbouring element; their
+            # empty product is 1, and the nonempty segment starts stay
+            # valid reduceat offsets because empty segments contribute
+            # no entries to the concatenation.
+            v = np.ones(n_reactions, dtype=powed.dtype if powed.size else self.dtype)
+            nonempty = lengths > 0
+            if powed.size:
+                v[nonempty] = np.multiply.reduceat(
+                    powed, self._react_offsets[:-1][nonempty]
+                )
+
+        return k * v
+
+    def build_rhs(self):
+        """
+        Build a mass-action RHS function from the finalized arrays.
+
+        Returns a closure f(t, c) -> dc/dt suitable for solve_ivp,
+        backed by the fused Numba kernel in rhs_numba (plain-Python
+        fallback when Numba is not installed). Reactions without a rate
+        constant default to k = 1.0, mirroring the kinetics module.
+        Only valid for pure mass-action networks; custom kinetic laws
+        live in KineticSystem.
+
+        Returns:
+            Function with signature f(t, c) -> dc/dt
+        """
+        from kinetics_playground.core.rhs_numba import mass_action_rhs
+
+        self.finalize()
+
+        k = np.array([
+            r.rate_constant if r.rate_constant is not None else 1.0
+            for r in self.reactions
+        ], dtype=self.dtype)
+        r_off, r_idx, r_coef = (
+            self._react_offsets, self._react_species, self._react_coefs
+        )
+        p_off, p_idx, p_coef = (
+            self._prod_offsets, self._prod_species, self._prod_coefs
+        )
+        n = len(self.species)
+
+        def rhs(t, c):
+            # Fresh output per call: solvers keep references to the
+            # arrays the RHS returns
+            dcdt = np.empty(n)
+            return mass_action_rhs(
+                c, k, r_off, r_idx, r_coef, p_off, p_idx, p_coef, dcdt
+            )
+
+        return rhs
+
     def get_species(self, name: str) -> Optional[Species]:
         """Get species by name."""
         return self._species_map.get(name)
@@ -177,12 +417,72 @@ class ReactionModel:
         species = self.get_species(species_name)
         if species:
             species.initial_concentration = concentration
+            self._ic[species.index] = concentration
         else:
             raise ValueError(f"Species '{species_name}' not found in model")
-    
+
+    def set_initial_concentrations(self, concentrations):
+        """
+        Bulk-set initial concentrations.
+
+        Repeated setup loops (parameter sweeps) pay one Python dict hash
+        per species when going through set_initial_concentration; this
+        resolves all names in a single vectorized searchsorted pass
+        against a sorted-name array built once per topology.
+
+        Args:
+            concentrations: Either a length-num_species array ordered by
+                species index, or a {name: value} dict (names resolved
+                in bulk; unknown names raise ValueError)
+
+        Raises:
+            ValueError: On unknown species names or wrong array length
+        """
+        n = len(self.species)
+
+        if isinstance(concentrations, dict):
+            if not concentrations:
+                return
+            if n == 0:
+                # No species at all: every key is unknown, and the
+                # searchsorted pass below would index an empty array
+                raise ValueError(
+                    f"Species not found in model: {', '.join(concentrations)}"
+                )
+            if self._name_arrays is None:
+                names = np.array(self.get_species_names())
+                order = np.argsort(names)
+                self._name_arrays = (names[order], order)
+            sorted_names, sorted_index = self._name_arrays
+
+            keys = np.array(list(concentrations.keys()))
+            values = np.fromiter(
+                concentrations.values(), dtype=np.float64,
+                count=len(concentrations)
+            )
+            pos = np.minimum(np.searchsorted(sorted_names, keys), n - 1)
+            if not np.all(sorted_names[pos] == keys):
+                unknown = keys[sorted_names[pos] != keys]
+                raise ValueError(f"Species not found in model: {', '.join(unknown)}")
+            indices = sorted_index[pos]
+        else:
+            values = np.asarray(concentrations, dtype=np.float64)
+            if values.shape != (n,):
+                raise ValueError(
+                    f"Expected {n} concentrations, got shape {values.shape}"
+                )
+            indices = np.arange(n)
+
+        self._ic[indices] = values
+        # Mirror into the dataclass fields (summaries/exporters read
+        # them); plain attribute stores, no name hashing
+        species = self.species
+        for i, value in zip(indices.tolist(), values.tolist()):
+            species[i].initial_concentration = value
+
     def get_initial_concentrations(self) -> np.ndarray:
         """Get array of initial concentrations for all species."""
-        return np.array([s.initial_concentration for s in self.species])
+        return self._ic[:len(self.species)].copy()
     
     def num_species(self) -> int:
         """Get number of species in the model."""
@@ -13,6 +13,32 @@ from dataclasses import dataclass
 import yaml
 import json
 
+# libyaml-backed loader when PyYAML was built with it: same safe-load
+# semantics, parsing in C instead of pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Reaction-grammar regexes, compiled once at import. Parsing loops
+# (parse_from_file, parse_multiple) reuse these directly; nothing in the
+# parse path should ever call re.compile per line.
+_SIMPLE_REACTION_RE = re.compile(
+    r'^([^-<>]+?)\s*(-?>|<->|<-)\s*([^;]+?)(?:\s*;\s*(.+))?$'
+)
+_STOICH_RE = re.compile(r'(\d*\.?\d*)\s*\*?\s*([A-Za-z_]\w*)')
+# Whole species-list scanner: anchors each term at the start of the
+# string or a '+', so one finditer pass yields every (coeff, name) pair
+# without splitting into per-term strings first
+_SPECIES_LIST_RE = re.compile(
+    r'(?:^|\+)\s*(\d*\.?\d*)\s*\*?\s*([A-Za-z_]\w*)'
+)
+# Single-digit coefficient fast path: almost all stoichiometric
+# coefficients in practice are small integers, and a dict probe is
+# cheaper than CPython's general float() string parser
+_SMALL_COEFFS = {str(i): float(i) for i in range(10)}
+
 
 @dataclass
 class ParsedReaction:
@@ -42,11 +68,10 @@ class ReactionParser:
         {'C': 1.0}
     """
     
-    # Regex patterns for parsing
-    SIMPLE_REACTION_PATTERN = re.compile(
-        r'^([^-<>]+?)\s*(-?>|<->|<-)\s*([^;]+?)(?:\s*;\s*(.+))?$'
-    )
-    STOICH_PATTERN = re.compile(r'(\d*\.?\d*)\s*\*?\s*([A-Za-z_]\w*)')
+    # Regex patterns for parsing (module-level compiled, aliased here
+    # for backwards compatibility)
+    SIMPLE_REACTION_PATTERN = _SIMPLE_REACTION_RE
+    STOICH_PATTERN = _STOICH_RE
     
     def __init__(self):
         self.species_set = set()
@@ -125,26 +150,31 @@ class ReactionParser:
             Dictionary mapping species names to stoichiometric coefficients
         """
         species_dict = {}
-        
-        # Split by + and parse each term
-        terms = [t.strip() for t in species_str.split('+')]
-        
-        for term in terms:
-            if not term:
-                continue
-                
-            match = self.STOICH_PATTERN.match(term)
-            if match:
-                coeff_str, species = match.groups()
-                coeff = float(coeff_str) if coeff_str else 1.0
-                
-                if species in species_dict:
-                    species_dict[species] += coeff
-                else:
-                    species_dict[species] = coeff
+
+        # One scan over the whole list instead of split('+') plus a
+        # fresh regex match per term
+        n_matched = 0
+        for match in _SPECIES_LIST_RE.finditer(species_str):
+            coeff_str, species = match.groups()
+            if not coeff_str:
+                coeff = 1.0
             else:
-                raise ValueError(f"Invalid species term: {term}")
-        
+                coeff = _SMALL_COEFFS.get(coeff_str)
+                if coeff is None:
+                    coeff = float(coeff_str)
+
+            if species in species_dict:
+                species_dict[species] += coeff
+            else:
+                species_dict[species] = coeff
+            n_matched += 1
+
+        # Every '+'-separated term must have produced exactly one match,
+        # otherwise part of the input was unparseable
+        n_terms = sum(1 for t in species_str.split('+') if t.strip())
+        if n_matched != n_terms:
+            raise ValueError(f"Invalid species list: {species_str}")
+
         return species_dict
     
     def parse_multiple(self, reaction_strings: List[str]) -> List[ParsedReaction]:
@@ -159,10 +189,13 @@ class ReactionParser:
         """
         return [self.parse_single(rs) for rs in reaction_strings]
     
-    def parse_from_yaml(self, yaml_string: str) -> List[ParsedReaction]:
+    def parse_from_yaml(self, yaml_string) -> List[ParsedReaction]:
         """
         Parse reactions from YAML format.
-        
+
+        Accepts a string or an open file object (yaml reads streams
+        directly, so files need not be slurped into memory first).
+
         Expected format:
             reactions:
               - equation: A + B -> C
@@ -171,7 +204,7 @@ class ReactionParser:
               - equation: C -> A + B
                 rate_constant: 0.05
         """
-        data = yaml.safe_load(yaml_string)
+        data = yaml.load(yaml_string, Loader=_YamlLoader)
         reactions = []
         
         for rxn_data in data.get('reactions', []):
@@ -205,9 +238,12 @@ class ReactionParser:
     
     def parse_from_json(self, json_string: str) -> List[ParsedReaction]:
         """Parse reactions from JSON format."""
-        data = json.loads(json_string)
+        return self._parse_json_data(json.loads(json_string))
+
+    def _parse_json_data(self, data: dict) -> List[ParsedReaction]:
+        """Build reactions from already-decoded JSON data."""
         reactions = []
-        
+
         for rxn_data in data.get('reactions', []):
             if 'equation' in rxn_data:
                 eq_str = rxn_data['equation']
@@ -237,21 +273,24 @@ class ReactionParser:
         - .json: JSON format
         - .rkp, .txt: Simple text format (one reaction per line)
         """
-        with open(filepath, 'r') as f:
-            content = f.read()
-        
+        # Stream from the open file instead of f.read() + split: the
+        # YAML/JSON loaders consume the stream directly and the text
+        # path parses line by line, so peak memory stays at one line
+        # (plus results) rather than two whole-file copies
         if filepath.endswith(('.yaml', '.yml')):
-            return self.parse_from_yaml(content)
+            with open(filepath, 'r') as f:
+                return self.parse_from_yaml(f)
         elif filepath.endswith('.json'):
-            return self.parse_from_json(content)
+            with open(filepath, 'r') as f:
+                return self._parse_json_data(json.load(f))
         else:
             # Text format: one reaction per line, skip comments and empty lines
-            lines = [
-                line.strip() 
-                for line in content.split('\n') 
-                if line.strip() and not line.strip().startswith('#')
-            ]
-            return self.parse_multiple(lines)
+            with open(filepath, 'r') as f:
+                return [
+                    self.parse_single(line)
+                    for line in (raw.strip() for raw in f)
+                    if line and not line.startswith('#')
+                ]
     
     def get_all_species(self) -> List[str]:
         """Get list of all species encountered during parsing."""
@@ -0,0 +1,54 @@
+"""
+Compiled mass-action RHS kernel over CSR-style stoichiometry arrays.
+
+The kernel fuses rate evaluation (v_j = k_j * prod c_i^nu_ij) with the
+stoichiometric accumulation (dc/dt = S . v) in one pass over the offset
+arrays produced by ReactionModel.finalize(), so an ODE step does no
+Python-level dispatch and no intermediate rate vector. Numba is an
+optional 'performance' dependency; without it the same function runs as
+plain Python, which callers should avoid in favour of the vectorized
+NumPy paths in KineticSystem.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without the extra
+    numba = None
+    HAVE_NUMBA = False
+
+
+def _mass_action_rhs(c, k, r_off, r_idx, r_coef, p_off, p_idx, p_coef, dcdt):
+    """
+    Fill dcdt with the mass-action time derivatives at concentrations c.
+
+    Args:
+        c: Concentration vector (num_species,)
+        k: Rate constants (num_reactions,)
+        r_off: Reactant segment offsets (num_reactions + 1,)
+        r_idx: Concatenated reactant species indices
+        r_coef: Concatenated reactant coefficients
+        p_off, p_idx, p_coef: Same layout for products
+        dcdt: Output buffer (num_species,), overwritten
+
+    Returns:
+        dcdt, for call-site convenience
+    """
+    dcdt[:] = 0.0
+    for j in range(k.shape[0]):
+        v = k[j]
+        for m in range(r_off[j], r_off[j + 1]):
+            v *= c[r_idx[m]] ** r_coef[m]
+        for m in range(r_off[j], r_off[j + 1]):
+            dcdt[r_idx[m]] -= r_coef[m] * v
+        for m in range(p_off[j], p_off[j + 1]):
+            dcdt[p_idx[m]] += p_coef[m] * v
+    return dcdt
+
+
+if HAVE_NUMBA:
+    mass_action_rhs = numba.njit(cache=True, fastmath=True)(_mass_action_rhs)
+else:
+    mass_action_rhs = _mass_action_rhs
@@ -20,44 +20,97 @@ class StoichiometricMatrix:
     - Negative values indicate consumption
     """
     
-    def __init__(self, model: ReactionModel):
+    def __init__(self, model: ReactionModel, dtype=None):
         """
         Initialize stoichiometric matrix from a reaction model.
-        
+
         Args:
             model: ReactionModel containing species and reactions
+            dtype: Optional floating dtype override for the matrix
+                entries; defaults to the model's dtype. float32 halves
+                the memory traffic of flux matvecs. The nullspace /
+                conservation-law computations always promote to float64
+                internally regardless of this setting.
         """
         self.model = model
+        self.dtype = np.dtype(dtype) if dtype is not None else model.dtype
+        self._sparse = None  # CSR form, kept by _build_matrix for sparse networks
+        self._rank_cache = None
+        self._nullspace_cache = None
         self.matrix = self._build_matrix()
         self.species_names = model.get_species_names()
         self.reaction_names = model.get_reaction_names()
-    
+
     def _build_matrix(self) -> np.ndarray:
         """
-        Construct the stoichiometric matrix.
-        
+        Construct the stoichiometric matrix from COO triplets.
+
+        One pass over the reactant and product entries appends
+        (row, col, coeff) triplets; the sparse constructor then sums
+        duplicates, which yields the net stoichiometry for catalysts
+        appearing on both sides without a per-reaction dict merge. For
+        large sparse networks the CSR form is kept so compute_flux can
+        do an O(nnz) SpMV instead of a dense matvec.
+
         Returns:
             numpy array of shape (num_species, num_reactions)
         """
+        from scipy.sparse import coo_matrix
+
         num_species = self.model.num_species()
         num_reactions = self.model.num_reactions()
-        
-        S = np.zeros((num_species, num_reactions))
-        
-        for reaction in self.model.reactions:
-            j = reaction.index
-            net_stoich = reaction.net_stoichiometry()
-            
-            for species_name, coeff in net_stoich.items():
-                i = self.model.get_species_index(species_name)
-                S[i, j] = coeff
-        
-        return S
+
+        # The finalized model already holds the triplets as concatenated
+        # arrays: species indices are the COO rows, the column array
+        # repeats each reaction index once per entry, and the
+        # coefficients get their sign from which side they came from.
+        # No Python-level per-reaction loop and no name hashing.
+        model = self.model
+        model.finalize()
+        reaction_ids = np.arange(num_reactions)
+        rows = np.concatenate((model._react_species, model._prod_species))
+        cols = np.concatenate((
+            np.repeat(reaction_ids, np.diff(model._react_offsets)),
+            np.repeat(reaction_ids, np.diff(model._prod_offsets))
+        ))
+        data = np.concatenate(
+            (-model._react_coefs, model._prod_coefs)
+        ).astype(self.dtype, copy=False)
+
+        coo = coo_matrix(
+            (data, (rows, cols)), shape=(num_species, num_reactions)
+        )
+
+        # Same sparsity heuristic as the vectorized RHS: small or dense
+        # matrices stay dense-only, where BLAS beats the sparse overhead
+        size = num_species * num_reactions
+        if size >= 256 and coo.nnz < 0.3 * size:
+            self._sparse = coo.tocsr()
+
+        return coo.toarray()
     
     def get_matrix(self) -> np.ndarray:
         """Get the stoichiometric matrix."""
         return self.matrix
-    
+
+    def get_sparse(self):
+        """
+        Get the matrix in CSR form, built lazily and cached.
+
+        Reaction networks are sparse (most species take part in few
+        reactions), so matvec-heavy consumers like the vectorized RHS
+        can walk only the nonzeros. The dense array in self.matrix is
+        unchanged and remains the canonical representation.
+
+        Returns:
+            scipy.sparse.csr_matrix of shape (num_species, num_reactions)
+        """
+        if self._sparse is None:
+            from scipy.sparse import csr_matrix
+            self._sparse = csr_matrix(self.matrix)
+        return self._sparse
+
+
     def get_species_vector(self, reaction_index: int) -> np.ndarray:
         """
         Get the stoichiometric vector for a specific reaction.
@@ -82,43 +135,69 @@ class StoichiometricMatrix:
         """
         return self.matrix[species_index, :]
     
-    def compute_flux(self, reaction_rates: np.ndarray) -> np.ndarray:
+    def compute_flux(self, reaction_rates: np.ndarray,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Compute the rate of change for all species given reaction rates.
-        
+
         d[S]/dt = S · v
-        
+
         Args:
             reaction_rates: Array of reaction rate values (length = num_reactions)
-            
+            out: Optional (num_species,) output buffer. Callers in tight
+                loops (ODE steppers) can reuse one buffer and skip the
+                per-call allocation on the dense path. The sparse path
+                cannot write in place (scipy matvec allocates), so there
+                the result is copied into out.
+
         Returns:
             Array of species time derivatives (length = num_species)
         """
+        if self._sparse is not None:
+            flux = self._sparse.dot(reaction_rates)
+            if out is not None:
+                np.copyto(out, flux)
+                return out
+            return flux
+        if out is not None:
+            return np.matmul(self.matrix, reaction_rates, out=out)
         return self.matrix @ reaction_rates
     
     def rank(self) -> int:
         """
         Calculate the rank of the stoichiometric matrix.
-        
+
         The rank indicates the number of independent reactions.
         """
-        return np.linalg.matrix_rank(self.matrix)
-    
+        if self._rank_cache is None:
+            self.nullspace()  # one SVD fills both caches
+        return self._rank_cache
+
     def nullspace(self) -> np.ndarray:
         """
         Calculate the nullspace (kernel) of the stoichiometric matrix.
-        
+
         The nullspace represents conservation laws in the system.
         Vectors in the nullspace correspond to linear combinations of
         species that remain constant throughout the reaction dynamics.
-        
+
+        One SVD serves rank() and every later nullspace()/
+        conservation_laws() call; the matrix is immutable for the
+        lifetime of this object, so the decomposition is cached.
+
         Returns:
             Array where each column is a basis vector for the nullspace
         """
-        u, s, vh = np.linalg.svd(self.matrix)
-        null_mask = (s <= 1e-10)
-        null_space = vh[null_mask].T
-        return null_space
+        if self._nullspace_cache is None:
+            # The rank-based slice of the full vh picks up the trailing
+            # null rows as well, which the old boolean mask over s
+            # missed (and mis-shaped) for wide matrices with more
+            # reactions than species.
+            u, s, vh = np.linalg.svd(self.matrix.astype(np.float64, copy=False))
+            rank = int(np.sum(s > 1e-10))
+            self._rank_cache = rank
+            self._nullspace_cache = vh[rank:].T
+        return self._nullspace_cache
     
     def conservation_laws(self) -> List[Dict[str, float]]:
         """
@@ -147,44 +226,59 @@ class StoichiometricMatrix:
         
         return laws
     
+    def check_balanced(self, element_composition: Dict[str, Dict[str, int]]) -> np.ndarray:
+        """
+        Check element balance for every reaction at once.
+
+        Builds the element-composition matrix C (elements x species)
+        and verifies all reactions with the single product C @ S: a
+        column of zeros means the corresponding reaction conserves
+        every element. Species without composition data contribute
+        nothing, matching the per-reaction checker's behavior.
+
+        Args:
+            element_composition: Dict mapping species names to element counts
+                                Example: {'A': {'C': 1, 'O': 2}, ...}
+
+        Returns:
+            Boolean array of length num_reactions
+        """
+        elements = sorted({
+            element
+            for composition in element_composition.values()
+            for element in composition
+        })
+        if not elements:
+            return np.ones(self.matrix.shape[1], dtype=bool)
+
+        element_index = {element: i for i, element in enumerate(elements)}
+        C = np.zeros((len(elements), self.matrix.shape[0]))
+        for species_name, composition in element_composition.items():
+            species = self.model.get_species(species_name)
+            if species is None:
+                continue
+            for element, count in composition.items():
+                C[element_index[element], species.index] = count
+
+        residual = C @ self.matrix
+        return np.all(np.abs(residual) < 1e-10, axis=0)
+
     def is_balanced(self, reaction_index: int, element_composition: Dict[str, Dict[str, int]]) -> bool:
         """
         Check if a reaction is element-balanced.
-        
+
+        Thin wrapper over check_balanced; validation passes over whole
+        imported models should call check_balanced once instead.
+
         Args:
             reaction_index: Index of reaction to check
             element_composition: Dict mapping species names to element counts
                                 Example: {'A': {'C': 1, 'O': 2}, ...}
-        
+
         Returns:
             True if the reaction conserves all elements
         """
-        reaction = self.model.reactions[reaction_index]
-        
-        # Collect all elements
-        all_elements = set()
-        for species in reaction.get_all_species():
-            if species in element_composition:
-                all_elements.update(element_composition[species].keys())
-        
-        # Check balance for each element
-        for element in all_elements:
-            balance = 0.0
-            
-            # Subtract reactants
-            for species, coeff in reaction.reactants.items():
-                if species in element_composition:
-                    balance -= coeff * element_composition[species].get(element, 0)
-            
-            # Add products
-            for species, coeff in reaction.products.items():
-                if species in element_composition:
-                    balance += coeff * element_composition[species].get(element, 0)
-            
-            if abs(balance) > 1e-10:
-                return False
-        
-        return True
+        return bool(self.check_balanced(element_composition)[reaction_index])
     
     def to_latex(self) -> str:
         """
@@ -193,17 +287,18 @@ class StoichiometricMatrix:
         Returns:
             LaTeX string for the matrix
         """
-        latex = r"\begin{bmatrix}" + "\n"
-        
-        for i in range(self.matrix.shape[0]):
-            row = " & ".join(f"{val:.2f}" if val != 0 else "0" 
-                           for val in self.matrix[i, :])
-            latex += row
-            if i < self.matrix.shape[0] - 1:
-                latex += r" \\" + "\n"
-        
-        latex += "\n" + r"\end{bmatrix}"
-        return latex
+        # Format every cell in C (np.char.mod) and mask zeros with one
+        # vectorized where, instead of an f-string plus branch per cell
+        cells = np.where(
+            self.matrix == 0, '0', np.char.mod('%.2f', self.matrix)
+        )
+        rows = [" & ".join(row) for row in cells]
+
+        return (
+            r"\begin{bmatrix}" + "\n"
+            + (" \\\\\n").join(rows)
+            + "\n" + r"\end{bmatrix}"
+        )
     
     def summary(self) -> str:
         """Generate a text summary of the stoichiometric matrix."""
@@ -0,0 +1,71 @@
+"""Tests for the high-level ReactionNetwork API."""
+
+import pytest
+import numpy as np
+from kinetics_playground.api.reaction_network import ReactionNetwork
+
+
+class TestParameterSweep:
+    """Test suite for parameter sweeps."""
+
+    def test_rate_sweep_varies_results(self):
+        """Swept rate constants must actually change the trajectories."""
+        network = ReactionNetwork("A -> B ; 0.1")
+        values = np.array([0.05, 0.5, 5.0])
+
+        results = network.parameter_sweep(
+            'k_0', values, {'A': 1.0, 'B': 0.0},
+            time_span=(0, 10), num_points=100
+        )
+
+        finals = [r.get_species('A')[-1] for r in results]
+        # Larger k means faster decay of A
+        assert finals[0] > finals[1] > finals[2]
+
+    def test_rate_sweep_varies_results_without_numba(self):
+        """The rate-ref fast path must honor use_numba=False.
+
+        Regression test: simulate() used to miss the sweep-installed
+        RHS cache when use_numba=False was passed through, rebuild at
+        the original rate constant, and return identical trajectories
+        for every sweep point.
+        """
+        network = ReactionNetwork("A -> B ; 0.1")
+        values = np.array([0.05, 0.5, 5.0])
+
+        results = network.parameter_sweep(
+            'k_0', values, {'A': 1.0, 'B': 0.0},
+            time_span=(0, 10), num_points=100, use_numba=False
+        )
+
+        finals = [r.get_species('A')[-1] for r in results]
+        assert finals[0] > finals[1] > finals[2]
+
+    def test_rate_sweep_implicit_method_matches_per_point(self):
+        """Sweeps with an implicit solver must track the swept constant.
+
+        Regression test: the fast path used to hand BDF/LSODA an
+        analytic Jacobian built from the model's original rate
+        constants while the RHS read the swept value.
+        """
+        values = np.array([0.05, 1.0])
+        network = ReactionNetwork("A -> B ; 0.1")
+
+        swept = network.parameter_sweep(
+            'k_0', values, {'A': 1.0, 'B': 0.0},
+            time_span=(0, 10), num_points=50, method='BDF'
+        )
+
+        for value, result in zip(values, swept):
+            reference = ReactionNetwork(f"A -> B ; {value}").simulate(
+                {'A': 1.0, 'B': 0.0},
+                time_span=(0, 10), num_points=50, method='BDF'
+            )
+            np.testing.assert_allclose(
+                result.get_species('A'), reference.get_species('A'),
+                rtol=1e-3, atol=1e-6
+            )
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
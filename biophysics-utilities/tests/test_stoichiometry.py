@@ -0,0 +1,49 @@
+"""Tests for the stoichiometric matrix."""
+
+import pytest
+import numpy as np
+from kinetics_playground.core.model import ReactionModel
+from kinetics_playground.core.stoichiometry import StoichiometricMatrix
+
+
+class TestStoichiometricMatrix:
+    """Test suite for stoichiometric matrix operations."""
+
+    def test_nullspace_annihilated_by_matrix(self):
+        """Nullspace columns must satisfy S @ N = 0."""
+        model = ReactionModel()
+        model.add_species('A')
+        model.add_species('B')
+        model.add_reaction({'A': 1}, {'B': 1}, rate_constant=1.0)
+        model.add_reaction({'B': 1}, {'A': 1}, rate_constant=1.0)
+
+        S = StoichiometricMatrix(model)
+        N = S.nullspace()
+
+        assert np.allclose(S.matrix @ N, 0.0)
+
+    def test_nullspace_wide_matrix(self):
+        """Wide matrices (more reactions than species) get the full basis.
+
+        Regression test: the boolean mask over the singular values used
+        to miss the trailing null rows of vh, returning a mis-shaped
+        basis whenever num_reactions > num_species.
+        """
+        model = ReactionModel()
+        model.add_species('A')
+        model.add_species('B')
+        model.add_reaction({'A': 1}, {'B': 1}, rate_constant=1.0)
+        model.add_reaction({'B': 1}, {'A': 1}, rate_constant=1.0)
+        model.add_reaction({'A': 1}, {'B': 1}, rate_constant=2.0)
+
+        S = StoichiometricMatrix(model)
+        N = S.nullspace()
+
+        # rank(S) = 1, so the kernel of the 2x3 matrix is 2-dimensional
+        assert S.rank() == 1
+        assert N.shape == (3, 2)
+        assert np.allclose(S.matrix @ N, 0.0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])